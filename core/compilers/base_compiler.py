@@ -1,9 +1,21 @@
+import hashlib
+import os
+import re
+import subprocess
+import tempfile
 from abc import ABC, abstractmethod
 from pathlib import Path
 
 from .compiled_file import CompiledFile
 from .compiler_type import CompilerType
 
+# Compiler scratch files are tiny and short-lived, so keep them on tmpfs when there is one.
+# LEVELUP_TMPDIR overrides this (e.g. a RAM disk on Windows).
+COMPILE_TEMP_ROOT = os.environ.get('LEVELUP_TMPDIR') or ('/dev/shm' if os.path.isdir('/dev/shm') else None)
+
+# Keep Windows from creating a console for every compiler process (0 elsewhere)
+CREATE_NO_WINDOW = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
 
 class BaseCompiler(ABC):
     @staticmethod
@@ -21,3 +33,64 @@ class BaseCompiler(ABC):
     def compile_file(self, source_file: Path, additional_flags: str = None,
                      optimization_level: int = 2) -> CompiledFile:
         pass
+
+    def get_fingerprint(self) -> str | None:
+        """Identifies the toolchain build and everything it implicitly compiles with.
+
+        Equal fingerprints mean equal output for equal input, so callers may reuse
+        compiled output across runs. None means output must not be reused.
+        """
+        return None
+
+    @staticmethod
+    def _fingerprint(*parts: str, files=()) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            digest.update(part.encode())
+            digest.update(b'\0')
+        for path in files:
+            digest.update(Path(path).read_bytes())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _split_batch_output(output: str, source_names: list[str]) -> list[str | None]:
+        """Split one compiler run's diagnostics across the sources of a batch, in order.
+
+        clang and cl.exe report a batch one translation unit at a time, and each
+        unit's diagnostics name its source file, so every line is credited to the
+        source most recently named. Lines before the first named source are dropped.
+        """
+        owners = {name: index for index, name in enumerate(source_names)}
+        names = sorted(source_names, key=len, reverse=True)
+        pattern = re.compile(r'(?<![\w.])(' + '|'.join(re.escape(name) for name in names) + r')(?![\w.])')
+
+        per_source = [[] for _ in source_names]
+        owner = None
+        for line in output.splitlines():
+            match = pattern.search(line)
+            if match:
+                owner = owners[match.group(1)]
+            if owner is not None:
+                per_source[owner].append(line)
+        return ['\n'.join(lines).strip() or None for lines in per_source]
+
+    def compile_source(self, source: str, additional_flags: str = None,
+                       optimization_level: int = 2) -> CompiledFile:
+        """Compile C++ source held in memory.
+
+        The default writes it to a temp file for compile_file(); compilers that
+        can read a translation unit from stdin override this.
+        """
+        with tempfile.TemporaryDirectory(dir=COMPILE_TEMP_ROOT) as temp_dir:
+            source_file = Path(temp_dir) / "source.cpp"
+            source_file.write_bytes(source.encode())
+            return self.compile_file(source_file, additional_flags, optimization_level)
+
+    def compile_sources(self, sources: list[str], additional_flags: str = None,
+                        optimization_level: int = 2) -> list[CompiledFile]:
+        """Compile several in-memory sources that share flags; returns CompiledFiles in order.
+
+        The default compiles them one by one; compilers with a high per-process
+        startup cost override this to compile the batch in a single run.
+        """
+        return [self.compile_source(source, additional_flags, optimization_level) for source in sources]
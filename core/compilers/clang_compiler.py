@@ -2,7 +2,7 @@ import subprocess
 import tempfile
 from pathlib import Path
 
-from .base_compiler import BaseCompiler
+from .base_compiler import BaseCompiler, COMPILE_TEMP_ROOT, CREATE_NO_WINDOW
 from .compiled_file import CompiledFile
 from .compiler_type import CompilerType
 from .. import logger
@@ -20,13 +20,13 @@ class ClangCompiler(BaseCompiler):
     def __init__(self):
         logger.info("Initializing ClangCompiler")
 
-        levelup_header = Path(__file__).parent.parent.parent / "LevelUp.h"
+        self.levelup_header = Path(__file__).parent.parent.parent / "LevelUp.h"
 
         self.default_flags = [
             '-std=c++20',
             '-Wall',
             f'-include',
-            str(levelup_header),
+            str(self.levelup_header),
         ]
 
         config = ToolConfig()
@@ -40,6 +40,7 @@ class ClangCompiler(BaseCompiler):
             )
             if result.returncode != 0:
                 raise RuntimeError(f"clang not found at {self.clang_path}")
+            self.version = result.stdout
             version_line = result.stdout.splitlines()[0]
             logger.info(f"ClangCompiler initialized: {version_line}")
         except FileNotFoundError:
@@ -54,16 +55,22 @@ class ClangCompiler(BaseCompiler):
     def get_name() -> str:
         return "Clang/LLVM"
 
-    def _run_clang(self, args, cwd=None, check=True):
+    def get_fingerprint(self) -> str:
+        # `clang --version` names the build and install dir, like ccache's compiler check
+        return self._fingerprint(self.version, *self.default_flags, files=[self.levelup_header])
+
+    def _run_clang(self, args, cwd=None, check=True, input=None):
         cmd = [self.clang_path] + args
         logger.debug(f"Running clang: {' '.join(cmd)}")
 
         result = subprocess.run(
             cmd,
             cwd=cwd,
+            input=input,
             capture_output=True,
             text=True,
-            check=check
+            check=check,
+            creationflags=CREATE_NO_WINDOW
         )
 
         if result.returncode != 0:
@@ -80,7 +87,7 @@ class ClangCompiler(BaseCompiler):
                      optimization_level: int = 2) -> CompiledFile:
         source_path = Path(source_file)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with tempfile.TemporaryDirectory(dir=COMPILE_TEMP_ROOT) as temp_dir:
             temp_path = Path(temp_dir)
             base_name = source_path.stem
             asm_file = temp_path / f"{base_name}.s"
@@ -110,3 +117,69 @@ class ClangCompiler(BaseCompiler):
                 asm_file=asm_file if asm_file.exists() else None,
                 warnings=warnings
             )
+
+    def compile_source(self, source: str, additional_flags: str = None,
+                       optimization_level: int = 2) -> CompiledFile:
+        # Read the translation unit from stdin and write ASM to stdout, so no files are touched
+        args = self.default_flags.copy()
+        args.append(self.OPTIMIZATION_FLAGS.get(optimization_level, '-O2'))
+        args.extend(['-S', '-masm=intel', '-o', '-'])
+
+        if additional_flags:
+            args.extend(additional_flags.split())
+
+        args.extend(['-x', 'c++', '-'])
+
+        result = self._run_clang(args, check=False, input=source)
+
+        if result.returncode != 0:
+            raise RuntimeError(f"Compilation failed: {result.stderr}")
+
+        warnings = result.stderr.strip() if result.stderr.strip() else None
+
+        return CompiledFile(
+            source_file=Path('-'),
+            asm_output=result.stdout,
+            warnings=warnings
+        )
+
+    def compile_sources(self, sources: list[str], additional_flags: str = None,
+                        optimization_level: int = 2) -> list[CompiledFile]:
+        # One driver run for the whole batch; with -S and no -o each .s lands next to its source
+        with tempfile.TemporaryDirectory(dir=COMPILE_TEMP_ROOT) as temp_dir:
+            temp_path = Path(temp_dir)
+            source_files = []
+            for index, source in enumerate(sources):
+                source_file = temp_path / f"source{index}.cpp"
+                source_file.write_bytes(source.encode())
+                source_files.append(source_file)
+
+            args = self.default_flags.copy()
+            args.append(self.OPTIMIZATION_FLAGS.get(optimization_level, '-O2'))
+            args.extend(['-S', '-masm=intel'])
+
+            if additional_flags:
+                args.extend(additional_flags.split())
+
+            args.extend(source_file.name for source_file in source_files)
+
+            result = self._run_clang(args, cwd=temp_path, check=False)
+
+            if result.returncode != 0:
+                error_output = result.stderr or result.stdout
+                raise RuntimeError(f"Compilation failed: {error_output}")
+
+            # clang reports the whole batch at once; give each file only its own diagnostics
+            warnings = self._split_batch_output(
+                (result.stdout or "") + (result.stderr or ""),
+                [source_file.name for source_file in source_files]
+            )
+
+            return [
+                CompiledFile(
+                    source_file=source_file,
+                    asm_file=source_file.with_suffix('.s'),
+                    warnings=file_warnings
+                )
+                for source_file, file_warnings in zip(source_files, warnings)
+            ]
@@ -9,7 +9,8 @@ class CompiledFile:
         ast=None,
         ir: str = None,
         obj_file: Path = None,
-        warnings: str = None
+        warnings: str = None,
+        asm_output: str = None
     ):
         self.source_file = Path(source_file)
         self.ast = ast
@@ -17,8 +18,10 @@ class CompiledFile:
         self.obj_file = obj_file
         self.warnings = warnings
 
-        # Read ASM content from file if provided
-        if asm_file and Path(asm_file).exists():
+        # Read ASM content from file if it was not captured in memory
+        if asm_output is not None:
+            self.asm_output = asm_output
+        elif asm_file and Path(asm_file).exists():
             self.asm_output = Path(asm_file).read_text(errors='ignore')
         else:
             self.asm_output = None
@@ -6,8 +6,9 @@ from .msvc_compiler import MSVCCompiler
 from .clang_compiler import ClangCompiler
 
 
-# Singleton instance cache
-_compiler_instance = None
+# One instance per compiler type, kept across set_compiler() switches so that
+# `--all` smoke runs and other repeated switches do not re-probe the toolchain
+_compiler_instances: Dict[CompilerType, BaseCompiler] = {}
 _compiler_type = CompilerType.MSVC  # Default compiler
 
 
@@ -17,25 +18,24 @@ def get_compiler() -> BaseCompiler:
     Returns the appropriate compiler based on the configured compiler type.
     This is the ONLY place in the codebase that should branch on compiler type.
     """
-    global _compiler_instance, _compiler_type
-
-    if _compiler_instance is not None:
-        return _compiler_instance
+    compiler = _compiler_instances.get(_compiler_type)
+    if compiler is not None:
+        return compiler
 
     if _compiler_type == CompilerType.MSVC:
-        _compiler_instance = MSVCCompiler()
+        compiler = MSVCCompiler()
     elif _compiler_type == CompilerType.CLANG:
-        _compiler_instance = ClangCompiler()
+        compiler = ClangCompiler()
     else:
         raise ValueError(f"Unsupported compiler type: {_compiler_type}")
 
-    return _compiler_instance
+    _compiler_instances[_compiler_type] = compiler
+    return compiler
 
 
 def reset_compiler():
-    """Reset compiler instance (for testing only)."""
-    global _compiler_instance
-    _compiler_instance = None
+    """Reset compiler instances (for testing only)."""
+    _compiler_instances.clear()
 
 
 def set_compiler(compiler_id: str):
@@ -47,19 +47,14 @@ def set_compiler(compiler_id: str):
     Raises:
         ValueError: If compiler_id is not recognized
     """
-    global _compiler_type, _compiler_instance
+    global _compiler_type
 
     # Convert string ID to enum
     try:
-        new_type = CompilerType(compiler_id)
+        _compiler_type = CompilerType(compiler_id)
     except ValueError:
         raise ValueError(f"Unknown compiler ID: {compiler_id}. Valid options: {[ct.value for ct in CompilerType]}")
 
-    # Only reset if compiler type actually changed
-    if new_type != _compiler_type:
-        _compiler_type = new_type
-        _compiler_instance = None
-
 
 class CompilerFactory:
     @staticmethod
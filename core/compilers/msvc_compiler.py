@@ -1,8 +1,9 @@
+import os
 import subprocess
 import tempfile
 from pathlib import Path
 
-from .base_compiler import BaseCompiler
+from .base_compiler import BaseCompiler, COMPILE_TEMP_ROOT, CREATE_NO_WINDOW
 from .compiled_file import CompiledFile
 from .compiler_type import CompilerType
 from .. import logger
@@ -22,7 +23,7 @@ class MSVCCompiler(BaseCompiler):
     def __init__(self):
         logger.info("Initializing MSVCCompiler")
 
-        levelup_header = Path(__file__).parent.parent.parent / "LevelUp.h"
+        self.levelup_header = Path(__file__).parent.parent.parent / "LevelUp.h"
 
         self.default_flags = [
             '/std:c++20',
@@ -30,7 +31,7 @@ class MSVCCompiler(BaseCompiler):
             '/EHsc',
             '/nologo',
             '/W3',
-            f'/FI{levelup_header}',
+            f'/FI{self.levelup_header}',
         ]
 
         config = ToolConfig()
@@ -61,6 +62,12 @@ class MSVCCompiler(BaseCompiler):
     def get_name() -> str:
         return "Microsoft Visual C++"
 
+    def get_fingerprint(self) -> str:
+        # cl.exe lives in a versioned directory; size and mtime catch in-place updates
+        cl_stat = os.stat(self.cl_path)
+        return self._fingerprint(self.cl_path, str(cl_stat.st_size), str(cl_stat.st_mtime_ns), self.arch,
+                                 *self.default_flags, files=[self.levelup_header])
+
     def _load_msvc_environment(self):
         cmd = f'"{self.vcvarsall}" {self.arch} && set'
 
@@ -88,7 +95,8 @@ class MSVCCompiler(BaseCompiler):
             capture_output=True,
             text=True,
             check=check,
-            env=self.env
+            env=self.env,
+            creationflags=CREATE_NO_WINDOW
         )
 
         if result.returncode != 0:
@@ -101,24 +109,27 @@ class MSVCCompiler(BaseCompiler):
 
         return result
 
+    def _optimization_args(self, optimization_level: int) -> list[str]:
+        args = self.default_flags.copy()
+        args.append(self.OPTIMIZATION_FLAGS.get(optimization_level, '/O2'))
+
+        # Disable iterator debugging for O3 to allow range-based for loop optimizations
+        if optimization_level >= 3:
+            args.append('/D_ITERATOR_DEBUG_LEVEL=0')
+        return args
+
     def compile_file(self, source_file: Path, additional_flags: str = None,
                      optimization_level: int = 2) -> CompiledFile:
         source_path = Path(source_file)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with tempfile.TemporaryDirectory(dir=COMPILE_TEMP_ROOT) as temp_dir:
             temp_path = Path(temp_dir)
             base_name = source_path.stem
             asm_file = temp_path / f"{base_name}.asm"
             obj_file = temp_path / f"{base_name}.obj"
 
             # Compile to ASM
-            args = self.default_flags.copy()
-            args.append(self.OPTIMIZATION_FLAGS.get(optimization_level, '/O2'))
-
-            # Disable iterator debugging for O3 to allow range-based for loop optimizations
-            if optimization_level >= 3:
-                args.append('/D_ITERATOR_DEBUG_LEVEL=0')
-
+            args = self._optimization_args(optimization_level)
             args.extend([
                 '/FA',
                 '/Fa' + str(asm_file),
@@ -146,3 +157,49 @@ class MSVCCompiler(BaseCompiler):
                 asm_file=asm_file if asm_file.exists() else None,
                 warnings=warnings
             )
+
+    def compile_sources(self, sources: list[str], additional_flags: str = None,
+                        optimization_level: int = 2) -> list[CompiledFile]:
+        # One cl.exe run for the whole batch, so its startup is paid once rather than per file
+        with tempfile.TemporaryDirectory(dir=COMPILE_TEMP_ROOT) as temp_dir:
+            temp_path = Path(temp_dir)
+            source_files = []
+            for index, source in enumerate(sources):
+                source_file = temp_path / f"source{index}.cpp"
+                source_file.write_bytes(source.encode())
+                source_files.append(source_file)
+
+            # A trailing separator makes /Fa and /Fo name outputs after each source file
+            args = self._optimization_args(optimization_level)
+            args.extend([
+                '/FA',
+                f'/Fa{temp_path}\\',
+                '/c',
+                f'/Fo{temp_path}\\',
+            ])
+
+            if additional_flags:
+                args.extend(additional_flags.split())
+
+            args.extend(str(source_file) for source_file in source_files)
+
+            result = self._run_cl(args, cwd=temp_path, check=False)
+
+            if result.returncode != 0:
+                error_output = result.stderr or result.stdout
+                raise RuntimeError(f"Compilation failed: {error_output}")
+
+            # cl.exe reports the whole batch at once; give each file only its own diagnostics
+            warnings = self._split_batch_output(
+                (result.stdout or "") + (result.stderr or ""),
+                [source_file.name for source_file in source_files]
+            )
+
+            return [
+                CompiledFile(
+                    source_file=source_file,
+                    asm_file=source_file.with_suffix('.asm'),
+                    warnings=file_warnings
+                )
+                for source_file, file_warnings in zip(source_files, warnings)
+            ]
@@ -0,0 +1,37 @@
+from core.compilers.base_compiler import BaseCompiler
+
+
+CLANG_BATCH_OUTPUT = """source0.cpp:1:14: warning: unused variable 'x' [-Wunused-variable]
+    1 | int f() { int x; return 0; }
+      |               ^
+1 warning generated.
+In file included from source2.cpp:1:
+./header.h:3:5: warning: unused function 'g' [-Wunused-function]
+1 warning generated.
+"""
+
+MSVC_BATCH_OUTPUT = """source0.cpp
+source1.cpp
+C:\\temp\\source1.cpp(1): warning C4101: 'x': unreferenced local variable
+source11.cpp
+"""
+
+
+def test_split_batch_output_credits_each_clang_diagnostic_to_its_source():
+    warnings = BaseCompiler._split_batch_output(CLANG_BATCH_OUTPUT, ["source0.cpp", "source1.cpp", "source2.cpp"])
+
+    assert warnings[0].startswith("source0.cpp:1:14: warning")
+    assert warnings[0].endswith("1 warning generated.")
+    assert warnings[1] is None
+    assert "header.h:3:5" in warnings[2]
+    assert "source0.cpp" not in warnings[2]
+
+
+def test_split_batch_output_does_not_confuse_similar_names():
+    names = [f"source{index}.cpp" for index in range(12)]
+
+    warnings = BaseCompiler._split_batch_output(MSVC_BATCH_OUTPUT, names)
+
+    assert "C4101" in warnings[1]
+    assert warnings[11] == "source11.cpp"
+    assert "C4101" not in warnings[11]
@@ -44,6 +44,33 @@ int main() { return f(); }
         assert len(compiled.asm_output) > 0
 
 
+def test_compile_source_matches_compile_file(clang_compiler):
+    test_code = """
+int f() { return 17; }
+int main() { return f(); }
+"""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        source_file = Path(temp_dir) / "test.cpp"
+        source_file.write_text(test_code)
+        from_file = clang_compiler.compile_file(source_file, optimization_level=0)
+
+    from_source = clang_compiler.compile_source(test_code, optimization_level=0)
+
+    assert from_source.asm_output
+    assert ASMValidatorO0().validate(from_file, from_source)
+
+
+def test_compile_sources_returns_one_result_per_source(clang_compiler):
+    sources = ["int f() { return 1; }", "int f() { return 2; }"]
+
+    compiled = clang_compiler.compile_sources(sources, optimization_level=0)
+
+    assert len(compiled) == 2
+    assert all(c.asm_output for c in compiled)
+    assert not ASMValidatorO0().validate(compiled[0], compiled[1])
+
+
 def test_asm_validator_with_clang(clang_compiler):
     test_original = """
 inline int squared(int x) { return x*x; }
@@ -2,8 +2,11 @@
 LevelUp logging module - debug logging to disk for troubleshooting
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 from datetime import datetime
 from pathlib import Path
 from enum import Enum
@@ -21,6 +24,7 @@ CURRENT_LOG_LEVEL = LogLevel.DEBUG
 LOG_FILENAME = "LevelUp.log"
 _logger_initialized = False
 _logger = None
+_listener = None
 
 
 def _get_log_path() -> Path:
@@ -45,7 +49,7 @@ def _rotate_existing_log():
 
 def _initialize_logger():
     """Initialize the logger with file handler"""
-    global _logger_initialized, _logger
+    global _logger_initialized, _logger, _listener
 
     if _logger_initialized:
         return _logger
@@ -78,14 +82,20 @@ def _initialize_logger():
     else:
         file_handler.setLevel(logging.WARNING)
 
-    _logger.addHandler(file_handler)
+    # Callers only enqueue records; a background listener does the file I/O
+    log_queue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    _logger.addHandler(logging.handlers.QueueHandler(log_queue))
     _logger_initialized = True
 
     # Log startup
     _logger.info("=" * 60)
     _logger.info("LevelUp Logger Started")
-    _logger.info(f"Log Level: {CURRENT_LOG_LEVEL.value}")
-    _logger.info(f"Log File: {log_path}")
+    _logger.info("Log Level: %s", CURRENT_LOG_LEVEL.value)
+    _logger.info("Log File: %s", log_path)
     _logger.info("=" * 60)
 
     return _logger
@@ -2,7 +2,9 @@
 ModProcessor - processes mod requests using the refactoring architecture.
 """
 
+import threading
 from pathlib import Path
+from typing import Dict
 
 from .compilers.compiler_factory import get_compiler
 from .validators.validator_factory import ValidatorFactory
@@ -25,6 +27,9 @@ class ModProcessor:
     4. Apply each refactoring (creates GitCommit)
     5. Validate each commit
     6. Rollback invalid commits
+
+    One instance may be shared by several worker threads. Mods on the same repo
+    are serialized, since they share a clone and work branch.
     """
 
     def __init__(self, repos_path: Path, git_path: str = 'git'):
@@ -32,10 +37,25 @@ class ModProcessor:
         self.compiler = get_compiler()
         self.repos_path = Path(repos_path).resolve()
         self.git_path = git_path
+        self._repo_locks: Dict[str, threading.Lock] = {}
+        self._repo_locks_lock = threading.Lock()
         logger.info("ModProcessor initialized successfully")
 
-    def process_mod(self, mod_request: ModRequest) -> Result:
-        """Process a mod request using refactorings."""
+    def _get_repo_lock(self, repo_url: str) -> threading.Lock:
+        with self._repo_locks_lock:
+            return self._repo_locks.setdefault(repo_url, threading.Lock())
+
+    def process_mod(self, mod_request: ModRequest, on_start=None) -> Result:
+        """Process a mod request using refactorings. Blocks while another mod on the same repo runs.
+
+        on_start, if given, is called once the repo lock is held, just before processing begins.
+        """
+        with self._get_repo_lock(mod_request.repo_url):
+            if on_start is not None:
+                on_start()
+            return self._process_mod(mod_request)
+
+    def _process_mod(self, mod_request: ModRequest) -> Result:
         mod_id = mod_request.id
         mod_instance = mod_request.mod_instance
 
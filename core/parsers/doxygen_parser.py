@@ -34,6 +34,7 @@ class DoxygenParser:
         self._symbols: Dict[str, BaseSymbol] = {}
         self._symbols_by_kind: Dict[SymbolKind, List[BaseSymbol]] = {}
         self._symbols_by_file: Dict[str, List[BaseSymbol]] = {}
+        self._names_lower: Dict[str, str] = {}  # doxygen_id -> lowercased name
         self._parsed = False
 
     def parse(self) -> None:
@@ -360,6 +361,8 @@ class DoxygenParser:
     def _build_indexes(self) -> None:
         """Build lookup indexes after parsing."""
         for symbol_id, symbol in self._symbols.items():
+            self._names_lower[symbol_id] = symbol.name.lower()
+
             if symbol.kind not in self._symbols_by_kind:
                 self._symbols_by_kind[symbol.kind] = []
             self._symbols_by_kind[symbol.kind].append(symbol)
@@ -498,6 +501,13 @@ class DoxygenParser:
 
         return []
 
+    def filter_symbols_by_name(self, symbols: List[BaseSymbol], name_filter: str) -> List[BaseSymbol]:
+        """Case-insensitive substring match on symbol names, using names lowercased at parse time."""
+        self.parse()
+        needle = name_filter.lower()
+        names_lower = self._names_lower
+        return [s for s in symbols if needle in names_lower[s.doxygen_id]]
+
     def get_symbol_by_id(self, doxygen_id: str) -> Optional[BaseSymbol]:
         """Get a symbol by its Doxygen ID."""
         self.parse()
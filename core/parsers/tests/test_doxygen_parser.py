@@ -0,0 +1,50 @@
+"""
+Tests for DoxygenParser lookup helpers.
+"""
+
+from core.parsers import DoxygenParser, SymbolKind
+from core.parsers.symbols import FunctionSymbol, ClassSymbol
+
+
+def _make_parser(tmp_path, symbols):
+    parser = DoxygenParser(tmp_path)
+    for i, symbol in enumerate(symbols):
+        symbol.doxygen_id = f'id{i}'
+        parser._symbols[symbol.doxygen_id] = symbol
+    parser._build_indexes()
+    parser._parsed = True
+    return parser
+
+
+def _function(name):
+    func = FunctionSymbol()
+    func.name = name
+    return func
+
+
+def _class(name):
+    cls = ClassSymbol(SymbolKind.CLASS)
+    cls.name = name
+    return cls
+
+
+def test_filter_symbols_by_name_is_case_insensitive_substring(tmp_path):
+    parser = _make_parser(tmp_path, [_function('GetValue'), _function('setvalue'), _function('reset'), _class('Value')])
+
+    matches = parser.filter_symbols_by_name(parser.get_all_symbols(), 'VALUE')
+
+    assert [s.name for s in matches] == ['GetValue', 'setvalue', 'Value']
+
+
+def test_filter_symbols_by_name_respects_input_subset(tmp_path):
+    parser = _make_parser(tmp_path, [_function('GetValue'), _class('Value')])
+
+    matches = parser.filter_symbols_by_name(parser.get_symbols_by_kind(SymbolKind.CLASS), 'value')
+
+    assert [s.name for s in matches] == ['Value']
+
+
+def test_filter_symbols_by_name_no_match(tmp_path):
+    parser = _make_parser(tmp_path, [_function('GetValue')])
+
+    assert parser.filter_symbols_by_name(parser.get_all_symbols(), 'missing') == []
@@ -46,6 +46,7 @@ class Repo:
         self.git_path = git_path
         self.post_checkout = post_checkout
         self._doxygen_parser: Optional[DoxygenParser] = None
+        self._doxygen_parser_mtime: Optional[int] = None  # st_mtime_ns of index.xml when parsed
         self._git_repo: Optional[git.Repo] = None
         self.compiled_files: list[CompiledFile] = []
 
@@ -401,17 +402,21 @@ class Repo:
         Returns:
             DoxygenParser instance if Doxygen data exists, None otherwise
         """
-        if not self.has_doxygen_data():
+        xml_unexpanded = self.get_doxygen_xml_unexpanded_dir()
+        try:
+            mtime = (xml_unexpanded / 'index.xml').stat().st_mtime_ns
+        except FileNotFoundError:
             return None
 
-        if self._doxygen_parser is None:
-            xml_unexpanded = self.get_doxygen_xml_unexpanded_dir()
+        # Rebuild if Doxygen output was regenerated, possibly by another Repo instance
+        if self._doxygen_parser is None or mtime != self._doxygen_parser_mtime:
             xml_expanded = self.get_doxygen_xml_expanded_dir()
             # Pass expanded dir only if it exists
             if xml_expanded.exists() and (xml_expanded / 'index.xml').exists():
                 self._doxygen_parser = DoxygenParser(xml_unexpanded, xml_expanded)
             else:
                 self._doxygen_parser = DoxygenParser(xml_unexpanded)
+            self._doxygen_parser_mtime = mtime
 
         return self._doxygen_parser
 
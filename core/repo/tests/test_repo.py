@@ -1,3 +1,4 @@
+import os
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock, call
@@ -653,3 +654,37 @@ class TestRepoCompilation:
         assert len(result) == 2
         assert mock_compiled1 in result
         assert mock_compiled2 in result
+
+
+class TestRepoDoxygenParser:
+    def _make_repo(self, temp_dir):
+        repo = Repo(
+            url="https://github.com/user/project.git",
+            repos_folder=temp_dir
+        )
+        repo.get_doxygen_xml_unexpanded_dir().mkdir(parents=True)
+        return repo
+
+    def test_returns_none_without_doxygen_data(self, temp_dir):
+        repo = Repo(
+            url="https://github.com/user/project.git",
+            repos_folder=temp_dir
+        )
+        assert repo.get_doxygen_parser() is None
+
+    def test_reuses_parser_while_index_unchanged(self, temp_dir):
+        repo = self._make_repo(temp_dir)
+        (repo.get_doxygen_xml_unexpanded_dir() / 'index.xml').write_text('<doxygenindex/>')
+
+        assert repo.get_doxygen_parser() is repo.get_doxygen_parser()
+
+    def test_rebuilds_parser_when_index_changes(self, temp_dir):
+        repo = self._make_repo(temp_dir)
+        index = repo.get_doxygen_xml_unexpanded_dir() / 'index.xml'
+        index.write_text('<doxygenindex/>')
+        first = repo.get_doxygen_parser()
+
+        stat = index.stat()
+        os.utime(index, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert repo.get_doxygen_parser() is not first
@@ -2,36 +2,34 @@
 """Smoke tests for mods and chained refactorings."""
 
 import argparse
+import re
 import sys
 import tempfile
 from pathlib import Path
 
-import git
-
 # Add parent directory to path to support running from core/ directory
 _file_path = Path(__file__).resolve()
 _core_path = _file_path.parent
 _project_root = _core_path.parent
 sys.path.insert(0, str(_project_root))
 
+from core.compilers.base_compiler import COMPILE_TEMP_ROOT
 from core.compilers.compiler_type import CompilerType
 from core.compilers.compiler_factory import get_compiler, set_compiler
-from core.validators.validator_id import ValidatorId
-from core.mods.mod_factory import ModFactory
-from core.repo.repo import Repo
-from core.parsers.symbol_table import SymbolTable
-from core.parsers.symbols import FunctionSymbol
-from core.refactorings.remove_function_qualifier import RemoveFunctionQualifier
-from core.refactorings.add_function_qualifier import AddFunctionQualifier
-from core.refactorings.qualifier_type import QualifierType
 
 # Import validator smoke tests from validators package
-from core.validators.smoketest import run_validator_smoke_tests
+from core.validators.smoketest import BAR60, DASH60, run_validator_smoke_tests
+
+# Report banners (BAR60/DASH60 are shared with the validator smoke tests)
+BAR40 = "=" * 40
+BAR80 = "=" * 80
 
 
 def create_mock_symbol(name: str, qualified_name: str, file_path: Path, line_number: int,
-                       prototype: str = "") -> FunctionSymbol:
+                       prototype: str = ""):
     """Create a mock FunctionSymbol object for testing."""
+    from core.parsers.symbols import FunctionSymbol
+
     symbol = FunctionSymbol()
     symbol.name = name
     symbol.qualified_name = qualified_name
@@ -42,11 +40,50 @@ def create_mock_symbol(name: str, qualified_name: str, file_path: Path, line_num
     return symbol
 
 
+# Class body with at most one level of nested braces (inline member function bodies)
+CLASS_BODY_PATTERN = r'\b(?:struct|class)\s+{}\b[^;{{]*(\{{(?:[^{{}}]|\{{[^{{}}]*\}})*\}})'
+
+
+def find_mock_symbol(content: str, symbol_name: str, file_path: Path):
+    """Find symbol_name in content without Doxygen; returns a mock FunctionSymbol or None.
+
+    Class::method resolves to the declaration in the class body, else the out-of-line definition.
+    """
+    function_name = symbol_name.split('::')[-1]
+    call_pattern = re.compile(rf'\b{re.escape(function_name)}\s*\(')
+
+    if '::' in symbol_name:
+        class_name = symbol_name.split('::')[0]
+        match = None
+        body = re.search(CLASS_BODY_PATTERN.format(re.escape(class_name)), content)
+        if body:
+            match = call_pattern.search(content, body.start(1), body.end(1))
+        if match is None:
+            match = re.search(rf'\b{re.escape(class_name)}::{re.escape(function_name)}\s*\(', content)
+    else:
+        match = call_pattern.search(content)
+
+    if match is None:
+        return None
+
+    line_start = content.rfind('\n', 0, match.start()) + 1
+    line_end = content.find('\n', match.start())
+    return create_mock_symbol(
+        name=function_name,
+        qualified_name=symbol_name,
+        file_path=file_path,
+        line_number=content.count('\n', 0, match.start()) + 1,
+        prototype=content[line_start:line_end if line_end != -1 else None].strip()
+    )
+
+
 # =============================================================================
 # Mod Smoke Tests
 # =============================================================================
 
 class ModSmokeTest:
+    __slots__ = ('name', 'mod_id', 'source', 'expected')
+
     def __init__(self, name: str, mod_id: str, source: str, expected: str):
         """source is input C++ code, expected is output C++ code after mod runs"""
         self.name = name
@@ -56,9 +93,9 @@ class ModSmokeTest:
 
 
 def print_header(title: str):
-    print("\n" + "=" * 40)
+    print("\n" + BAR40)
     print(title)
-    print("=" * 40)
+    print(BAR40)
 
 
 MOD_SMOKE_TESTS = [
@@ -67,82 +104,61 @@ MOD_SMOKE_TESTS = [
 
 
 
-def run_mod_smoke_tests():
+def run_mod_smoke_tests(temp_root: Path):
+    # Repo/parser/mod imports are deferred so `--help` and validator-only runs skip them
+    from core.mods.mod_factory import ModFactory
+    from core.repo.repo import Repo
+    from core.parsers.symbol_table import SymbolTable
+
     total_passed = 0
     total_failed = 0
 
-    for test in MOD_SMOKE_TESTS:
+    for test_num, test in enumerate(MOD_SMOKE_TESTS):
         print(f"\nRunning: {test.name}")
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        temp_path = temp_root / f"mod{test_num}"
+        temp_path.mkdir()
 
-            # Write source file
-            source_file = temp_path / "test.cpp"
-            source_file.write_text(test.source)
+        # Write source file
+        source_file = temp_path / "test.cpp"
+        source_file.write_text(test.source)
 
-            # Create minimal repo and symbol table for testing
-            # Note: Using temp_path as both repos_folder and repo location for simplicity
-            repo = Repo(url="file:///test-repo", repos_folder=temp_path.parent)
-            repo.repo_path = temp_path  # Override to use temp directory directly
-            symbols = SymbolTable(repo)  # Empty symbol table is fine for simple tests
+        # Create minimal repo and symbol table for testing
+        # Note: Using temp_path as both repos_folder and repo location for simplicity
+        repo = Repo(url="file:///test-repo", repos_folder=temp_path.parent)
+        repo.repo_path = temp_path  # Override to use temp directory directly
+        symbols = SymbolTable(repo)  # Empty symbol table is fine for simple tests
 
-            # Create and run mod
-            mod = ModFactory.from_id(test.mod_id)
+        # Create and run mod
+        mod = ModFactory.from_id(test.mod_id)
 
-            # Apply all refactorings from the mod
-            for refactoring, *args in mod.generate_refactorings(repo, symbols):
-                # Apply the refactoring (modifies file in-place)
-                refactoring.apply(*args)
+        # Apply all refactorings from the mod
+        for refactoring, *args in mod.generate_refactorings(repo, symbols):
+            # Apply the refactoring (modifies file in-place)
+            refactoring.apply(*args)
 
-            # Read result and compare
-            result = source_file.read_text()
+        # Read result and compare
+        result = source_file.read_text()
 
-            if result == test.expected:
-                print(f"  PASS")
-                total_passed += 1
-            else:
-                print(f"  FAIL - output does not match expected")
-                print(f"  Expected:\n{repr(test.expected)}")
-                print(f"  Got:\n{repr(result)}")
-                total_failed += 1
+        if result == test.expected:
+            print(f"  PASS")
+            total_passed += 1
+        else:
+            print(f"  FAIL - output does not match expected")
+            print(f"  Expected:\n{repr(test.expected)}")
+            print(f"  Got:\n{repr(result)}")
+            total_failed += 1
 
     return total_passed, total_failed
 
 
-def run_chained_refactoring_tests(compilers):
-    """Run chained refactoring tests showing progressive modernization."""
-    print("\n" + "=" * 80)
-    print("CHAINED REFACTORING TESTS")
-    print("=" * 80)
-
-    import subprocess
-    import gc
-    import platform
-
-    total_passed = 0
-    total_failed = 0
-
-    for compiler_type in compilers:
-        print(f"\n{'=' * 60}")
-        print(f"Testing with compiler: {compiler_type.value}")
-        print('=' * 60)
-
-        # Set compiler type
-        set_compiler(compiler_type.value)
-        compiler = get_compiler()
-        print(f"Initialized compiler: {compiler.get_name()}")
-
-        # On Windows, manually manage temp directory to avoid file handle issues
-        temp_dir_obj = tempfile.TemporaryDirectory()
-        temp_dir = temp_dir_obj.name
-        try:
-            temp_path = Path(temp_dir)
-            source_file = temp_path / "modernize_me.cpp"
+# =============================================================================
+# Chained Refactoring Tests
+# =============================================================================
 
-            # Create C++ file with various modernization opportunities
-            # This file will be progressively modernized through chained refactorings
-            initial_source = """// Legacy C++ code needing modernization
+# C++ file with various modernization opportunities
+# Each compiler's chain progressively modernizes its own copy of it
+CHAINED_SOURCE = """// Legacy C++ code needing modernization
 
 inline int squared(int x) {
     return x * x;
@@ -212,206 +228,207 @@ int main() {
 }
 """
 
-            source_file.write_text(initial_source)
-
-            # Initialize git repository using GitPython (faster than subprocess)
-            test_repo = git.Repo.init(temp_path)
-            test_repo.index.add('*')
-            # Configure git user for commit
-            with test_repo.config_writer() as config:
-                config.set_value('user', 'name', 'LevelUp Test')
-                config.set_value('user', 'email', 'test@levelup.com')
-            test_repo.index.commit('Initial legacy code')
-            test_repo.close()  # Close to release file handles
-            del test_repo  # Delete reference to help GC
-
-            # Create repo
-            repo = Repo(url="file:///test-chained-refactoring", repos_folder=temp_path.parent)
-            repo.repo_path = temp_path
-
-            # Run Doxygen to extract symbols
-            print("\nGenerating Doxygen symbols...")
-            symbols = SymbolTable(repo)
-            try:
-                repo.generate_doxygen()
-                symbols.load_from_doxygen()
-                print(f"  Doxygen generated {len(symbols.get_all_symbols())} symbols")
-            except Exception as e:
-                print(f"  WARNING: Doxygen failed ({e}), using mock symbols")
-
-            # Ensure any GitPython handles are released before temp cleanup
-            import gc
-            gc.collect()  # Force garbage collection to release any lingering handles
-
-            # Define chain of refactorings that build on each other progressively
-            # Each refactoring is tested with O0 validation, building cumulative modernization
-            # Tests mimic validator smoke tests but chain together on a single file
-            refactoring_chain = [
-                # Test 1: Remove inline qualifiers (mimics remove_inline validator test)
-                {
-                    'name': 'Remove inline from squared()',
-                    'refactoring_class': RemoveFunctionQualifier,
-                    'symbol_lookup': 'squared',
-                    'qualifier': QualifierType.INLINE,
-                    'validator_id': ValidatorId.ASM_O0,
-                },
-                {
-                    'name': 'Remove inline from cubed()',
-                    'refactoring_class': RemoveFunctionQualifier,
-                    'symbol_lookup': 'cubed',
-                    'qualifier': QualifierType.INLINE,
-                    'validator_id': ValidatorId.ASM_O0,
-                },
-                {
-                    'name': 'Remove inline from add()',
-                    'refactoring_class': RemoveFunctionQualifier,
-                    'symbol_lookup': 'add',
-                    'qualifier': QualifierType.INLINE,
-                    'validator_id': ValidatorId.ASM_O0,
-                },
-                # Test 2: Add override qualifiers (mimics add_override validator test)
-                {
-                    'name': 'Add override to Derived::compute()',
-                    'refactoring_class': AddFunctionQualifier,
-                    'symbol_lookup': 'Derived::compute',
-                    'qualifier': QualifierType.OVERRIDE,
-                    'validator_id': ValidatorId.ASM_O0,
-                },
-                {
-                    'name': 'Add override to Derived::process()',
-                    'refactoring_class': AddFunctionQualifier,
-                    'symbol_lookup': 'Derived::process',
-                    'qualifier': QualifierType.OVERRIDE,
-                    'validator_id': ValidatorId.ASM_O0,
-                },
-                {
-                    'name': 'Add override to Derived::calculate()',
-                    'refactoring_class': AddFunctionQualifier,
-                    'symbol_lookup': 'Derived::calculate',
-                    'qualifier': QualifierType.OVERRIDE,
-                    'validator_id': ValidatorId.ASM_O0,
-                },
-                # Test 3: Add final to methods (mimics add_final_method validator test)
-                {
-                    'name': 'Add final to Derived::calculate()',
-                    'refactoring_class': AddFunctionQualifier,
-                    'symbol_lookup': 'Derived::calculate',
-                    'qualifier': QualifierType.FINAL,
-                    'validator_id': ValidatorId.ASM_O0,
-                },
-                # Test 4: Add const qualifiers to methods (mimics const_method validator test)
-                {
-                    'name': 'Add const to Point::getX()',
-                    'refactoring_class': AddFunctionQualifier,
-                    'symbol_lookup': 'Point::getX',
-                    'qualifier': QualifierType.CONST,
-                    'validator_id': ValidatorId.ASM_O0,
-                },
-                {
-                    'name': 'Add const to Point::getY()',
-                    'refactoring_class': AddFunctionQualifier,
-                    'symbol_lookup': 'Point::getY',
-                    'qualifier': QualifierType.CONST,
-                    'validator_id': ValidatorId.ASM_O0,
-                },
-                # Test 5: Add noexcept to free functions (mimics add_noexcept validator test)
-                {
-                    'name': 'Add noexcept to squared()',
-                    'refactoring_class': AddFunctionQualifier,
-                    'symbol_lookup': 'squared',
-                    'qualifier': QualifierType.NOEXCEPT,
-                    'validator_id': ValidatorId.ASM_O0,
-                },
-                {
-                    'name': 'Add noexcept to cubed()',
-                    'refactoring_class': AddFunctionQualifier,
-                    'symbol_lookup': 'cubed',
-                    'qualifier': QualifierType.NOEXCEPT,
-                    'validator_id': ValidatorId.ASM_O0,
-                },
-                # Test 6: Add [[nodiscard]] attribute (mimics add_nodiscard validator test)
-                {
-                    'name': 'Add [[nodiscard]] to compute()',
-                    'refactoring_class': AddFunctionQualifier,
-                    'symbol_lookup': 'compute',
-                    'qualifier': QualifierType.NODISCARD,
-                    'validator_id': ValidatorId.ASM_O0,
-                },
-            ]
-
-            print("\n" + "-" * 60)
-            print("Progressive Modernization Chain")
-            print("-" * 60)
-
-            for step_num, step in enumerate(refactoring_chain, start=1):
-                print(f"\nStep {step_num}: {step['name']}")
-
-                # Store content before refactoring
-                content_before = source_file.read_text()
-
-                # Find symbol (from Doxygen or create mock)
-                symbol_name = step['symbol_lookup']
-                symbol = symbols.get_symbol(symbol_name)
-
-                if symbol is None:
-                    # Create mock symbol if Doxygen didn't find it
-                    print(f"  Creating mock symbol for '{symbol_name}'")
-                    # Parse file to find the symbol
-                    lines = content_before.split('\n')
-                    function_name = symbol_name.split('::')[-1]
-                    class_name = symbol_name.split('::')[0] if '::' in symbol_name else None
-
-                    # Look for function declaration/definition
-                    # For qualified names (Class::method), find the class context first
-                    in_target_class = False
-                    class_depth = 0
-
-                    for line_num, line in enumerate(lines, start=1):
-                        stripped = line.strip()
-
-                        # Track class context for qualified names
-                        if class_name:
-                            if f'struct {class_name}' in stripped or f'class {class_name}' in stripped:
-                                in_target_class = True
-                                class_depth = 0
-                            if in_target_class:
-                                class_depth += stripped.count('{') - stripped.count('}')
-                                if class_depth < 0:
-                                    in_target_class = False
-
-                        # Check if this line contains the function name
-                        if function_name in line:
-                            # For qualified names, check if we're in the right class or it's a definition
-                            if class_name:
-                                # Either in the class declaration or it's an out-of-line definition
-                                is_definition = f'{class_name}::{function_name}' in stripped
-                                if not (in_target_class or is_definition):
-                                    continue
-
-                            # Check if it looks like a function declaration or definition
-                            if (('(' in stripped and function_name in stripped) or
-                                ('virtual' in stripped and function_name in stripped) or
-                                (f'{function_name}(' in stripped)):
-                                symbol = create_mock_symbol(
-                                    name=function_name,
-                                    qualified_name=symbol_name,
-                                    file_path=source_file,
-                                    line_number=line_num,
-                                    prototype=stripped
-                                )
-                                break
-
-                if symbol is None:
-                    print(f"  FAIL - Could not find symbol '{symbol_name}'")
-                    total_failed += 1
-                    continue
 
-                # Get validator and optimization level
-                from core.validators.validator_factory import ValidatorFactory
-                validator = ValidatorFactory.from_id(step['validator_id'])
-                optimization_level = validator.get_optimization_level()
+def run_chained_refactoring_tests(compilers, temp_root: Path):
+    """Run chained refactoring tests showing progressive modernization."""
+    print("\n" + BAR80)
+    print("CHAINED REFACTORING TESTS")
+    print(BAR80)
+
+    from core.repo.repo import Repo
+    from core.parsers.symbol_table import SymbolTable
+    from core.refactorings.remove_function_qualifier import RemoveFunctionQualifier
+    from core.refactorings.add_function_qualifier import AddFunctionQualifier
+    from core.refactorings.qualifier_type import QualifierType
+    from core.validators.validator_id import ValidatorId
+    from core.validators.validator_factory import ValidatorFactory
+
+    # Define chain of refactorings that build on each other progressively
+    # Each refactoring is tested with O0 validation, building cumulative modernization
+    # Tests mimic validator smoke tests but chain together on a single file
+    refactoring_chain = [
+        # Test 1: Remove inline qualifiers (mimics remove_inline validator test)
+        {
+            'name': 'Remove inline from squared()',
+            'refactoring_class': RemoveFunctionQualifier,
+            'symbol_lookup': 'squared',
+            'qualifier': QualifierType.INLINE,
+            'validator_id': ValidatorId.ASM_O0,
+        },
+        {
+            'name': 'Remove inline from cubed()',
+            'refactoring_class': RemoveFunctionQualifier,
+            'symbol_lookup': 'cubed',
+            'qualifier': QualifierType.INLINE,
+            'validator_id': ValidatorId.ASM_O0,
+        },
+        {
+            'name': 'Remove inline from add()',
+            'refactoring_class': RemoveFunctionQualifier,
+            'symbol_lookup': 'add',
+            'qualifier': QualifierType.INLINE,
+            'validator_id': ValidatorId.ASM_O0,
+        },
+        # Test 2: Add override qualifiers (mimics add_override validator test)
+        {
+            'name': 'Add override to Derived::compute()',
+            'refactoring_class': AddFunctionQualifier,
+            'symbol_lookup': 'Derived::compute',
+            'qualifier': QualifierType.OVERRIDE,
+            'validator_id': ValidatorId.ASM_O0,
+        },
+        {
+            'name': 'Add override to Derived::process()',
+            'refactoring_class': AddFunctionQualifier,
+            'symbol_lookup': 'Derived::process',
+            'qualifier': QualifierType.OVERRIDE,
+            'validator_id': ValidatorId.ASM_O0,
+        },
+        {
+            'name': 'Add override to Derived::calculate()',
+            'refactoring_class': AddFunctionQualifier,
+            'symbol_lookup': 'Derived::calculate',
+            'qualifier': QualifierType.OVERRIDE,
+            'validator_id': ValidatorId.ASM_O0,
+        },
+        # Test 3: Add final to methods (mimics add_final_method validator test)
+        {
+            'name': 'Add final to Derived::calculate()',
+            'refactoring_class': AddFunctionQualifier,
+            'symbol_lookup': 'Derived::calculate',
+            'qualifier': QualifierType.FINAL,
+            'validator_id': ValidatorId.ASM_O0,
+        },
+        # Test 4: Add const qualifiers to methods (mimics const_method validator test)
+        {
+            'name': 'Add const to Point::getX()',
+            'refactoring_class': AddFunctionQualifier,
+            'symbol_lookup': 'Point::getX',
+            'qualifier': QualifierType.CONST,
+            'validator_id': ValidatorId.ASM_O0,
+        },
+        {
+            'name': 'Add const to Point::getY()',
+            'refactoring_class': AddFunctionQualifier,
+            'symbol_lookup': 'Point::getY',
+            'qualifier': QualifierType.CONST,
+            'validator_id': ValidatorId.ASM_O0,
+        },
+        # Test 5: Add noexcept to free functions (mimics add_noexcept validator test)
+        {
+            'name': 'Add noexcept to squared()',
+            'refactoring_class': AddFunctionQualifier,
+            'symbol_lookup': 'squared',
+            'qualifier': QualifierType.NOEXCEPT,
+            'validator_id': ValidatorId.ASM_O0,
+        },
+        {
+            'name': 'Add noexcept to cubed()',
+            'refactoring_class': AddFunctionQualifier,
+            'symbol_lookup': 'cubed',
+            'qualifier': QualifierType.NOEXCEPT,
+            'validator_id': ValidatorId.ASM_O0,
+        },
+        # Test 6: Add [[nodiscard]] attribute (mimics add_nodiscard validator test)
+        {
+            'name': 'Add [[nodiscard]] to compute()',
+            'refactoring_class': AddFunctionQualifier,
+            'symbol_lookup': 'compute',
+            'qualifier': QualifierType.NODISCARD,
+            'validator_id': ValidatorId.ASM_O0,
+        },
+    ]
+
+    # Validators are stateless; build one per distinct ID rather than one per step
+    validators = {
+        validator_id: ValidatorFactory.from_id(validator_id)
+        for validator_id in {step['validator_id'] for step in refactoring_chain}
+    }
+
+    total_passed = 0
+    total_failed = 0
+
+    for compiler_type in compilers:
+        print("\n" + BAR60)
+        print(f"Testing with compiler: {compiler_type.value}")
+        print(BAR60)
+
+        # Set compiler type
+        set_compiler(compiler_type.value)
+        compiler = get_compiler()
+        print(f"Initialized compiler: {compiler.get_name()}")
+
+        temp_path = temp_root / f"chain_{compiler_type.value}"
+        temp_path.mkdir()
+        source_file = temp_path / "modernize_me.cpp"
+        source_file.write_text(CHAINED_SOURCE)
+
+        # Create repo and its initial commit with the git CLI; user config stays in the
+        # scratch repo because refactorings commit through GitPython
+        repo = Repo(url="file:///test-chained-refactoring", repos_folder=temp_path.parent)
+        repo.repo_path = temp_path
+        repo._run_git(['init', '--quiet'])
+        repo._run_git(['config', 'user.name', 'LevelUp Test'])
+        repo._run_git(['config', 'user.email', 'test@levelup.com'])
+        repo._run_git(['add', '--all'])
+        repo._run_git(['commit', '--quiet', '-m', 'Initial legacy code'])
+
+        # Run Doxygen to extract symbols
+        print("\nGenerating Doxygen symbols...")
+        symbols = SymbolTable(repo)
+        try:
+            repo.generate_doxygen()
+            symbols.load_from_doxygen()
+            print(f"  Doxygen generated {len(symbols.get_all_symbols())} symbols")
+        except Exception as e:
+            print(f"  WARNING: Doxygen failed ({e}), using mock symbols")
+
+        # Refactorings only hold the repo; build one per class for this compiler's repo
+        refactorings = {
+            refactoring_class: refactoring_class(repo)
+            for refactoring_class in {step['refactoring_class'] for step in refactoring_chain}
+        }
+
+        print("\n" + DASH60)
+        print("Progressive Modernization Chain")
+        print(DASH60)
+
+        # Latest (content, compiled) per optimization level; a passing step's modified
+        # compile is the next step's original
+        last_compiled = {}
+
+        # Current file content; the file is only re-read after a refactoring writes it
+        content = source_file.read_text()
+
+        for step_num, step in enumerate(refactoring_chain, start=1):
+            print(f"\nStep {step_num}: {step['name']}")
+
+            # Store content before refactoring
+            content_before = content
+
+            # Find symbol (from Doxygen or create mock)
+            symbol_name = step['symbol_lookup']
+            symbol = symbols.get_symbol(symbol_name)
+
+            if symbol is None:
+                # Create mock symbol if Doxygen didn't find it
+                print(f"  Creating mock symbol for '{symbol_name}'")
+                symbol = find_mock_symbol(content_before, symbol_name, source_file)
+
+            if symbol is None:
+                print(f"  FAIL - Could not find symbol '{symbol_name}'")
+                total_failed += 1
+                continue
+
+            # Get validator and optimization level
+            validator = validators[step['validator_id']]
+            optimization_level = validator.get_optimization_level()
 
-                # Compile original
+            # Compile original, unless the previous step already compiled this exact content
+            cached = last_compiled.get(optimization_level)
+            if cached is not None and cached[0] == content_before:
+                original_compiled = cached[1]
+            else:
                 try:
                     original_compiled = compiler.compile_file(
                         source_file, optimization_level=optimization_level
@@ -420,68 +437,60 @@ int main() {
                     print(f"  FAIL - Original compilation failed: {e}")
                     total_failed += 1
                     continue
+                last_compiled[optimization_level] = (content_before, original_compiled)
 
-                # Apply refactoring
-                refactoring = step['refactoring_class'](repo)
-                git_commit = refactoring.apply(symbol, step['qualifier'])
+            # Apply refactoring
+            refactoring = refactorings[step['refactoring_class']]
+            git_commit = refactoring.apply(symbol, step['qualifier'])
 
-                if git_commit is None:
-                    print(f"  FAIL - Refactoring returned None (not applicable)")
-                    total_failed += 1
-                    continue
+            if git_commit is None:
+                print(f"  FAIL - Refactoring returned None (not applicable)")
+                total_failed += 1
+                # A refactoring can fail after writing the file, so don't assume it is unchanged
+                content = source_file.read_text()
+                continue
+
+            # Check that file was modified
+            content_after = source_file.read_text()
+            if content_before == content_after:
+                print(f"  FAIL - No changes made to file (refactoring must make changes)")
+                total_failed += 1
+                continue
 
-                # Check that file was modified
-                content_after = source_file.read_text()
-                if content_before == content_after:
-                    print(f"  FAIL - No changes made to file (refactoring must make changes)")
-                    total_failed += 1
-                    continue
+            print(f"  File modified: {len(content_after)} bytes (was {len(content_before)} bytes)")
 
-                print(f"  File modified: {len(content_after)} bytes (was {len(content_before)} bytes)")
+            # Compile modified
+            try:
+                modified_compiled = compiler.compile_file(
+                    source_file, optimization_level=optimization_level
+                )
+            except Exception as e:
+                print(f"  FAIL - Modified compilation failed: {e}")
+                # Rollback for next test
+                source_file.write_text(content_before)
+                total_failed += 1
+                continue
 
-                # Compile modified
-                try:
-                    modified_compiled = compiler.compile_file(
-                        source_file, optimization_level=optimization_level
-                    )
-                except Exception as e:
-                    print(f"  FAIL - Modified compilation failed: {e}")
-                    # Rollback for next test
-                    source_file.write_text(content_before)
-                    total_failed += 1
-                    continue
+            # Validate
+            is_valid = validator.validate(original_compiled, modified_compiled)
 
-                # Validate
-                is_valid = validator.validate(original_compiled, modified_compiled)
+            if is_valid:
+                print(f"  PASS - Validation successful")
+                total_passed += 1
+                content = content_after
+                last_compiled[optimization_level] = (content_after, modified_compiled)
+                # Keep the change (commit already created by refactoring)
+            else:
+                print(f"  FAIL - Validation failed")
+                total_failed += 1
+                # Rollback
+                source_file.write_text(content_before)
 
-                if is_valid:
-                    print(f"  PASS - Validation successful")
-                    total_passed += 1
-                    # Keep the change (commit already created by refactoring)
-                else:
-                    print(f"  FAIL - Validation failed")
-                    total_failed += 1
-                    # Rollback
-                    source_file.write_text(content_before)
-
-            # Print final modernized code
-            print("\n" + "-" * 60)
-            print("Final modernized code:")
-            print("-" * 60)
-            print(source_file.read_text())
-        finally:
-            # Cleanup with retry on Windows
-            gc.collect()  # Release any lingering handles
-            if platform.system() == 'Windows':
-                import time
-                # Give Windows time to release file handles
-                time.sleep(0.5)
-            try:
-                temp_dir_obj.cleanup()
-            except PermissionError:
-                # On Windows, if cleanup fails, warn but don't crash
-                print(f"\n  WARNING: Could not clean up temp directory: {temp_dir}")
-                pass
+        # Print final modernized code
+        print("\n" + DASH60)
+        print("Final modernized code:")
+        print(DASH60)
+        print(content)
 
     return total_passed, total_failed
 
@@ -495,26 +504,37 @@ def run_smoke_tests(compilers):
     print_header("VALIDATOR SMOKE TESTS")
     validator_passed, validator_failed = run_validator_smoke_tests(compilers)
 
-    print_header("MOD SMOKE TESTS")
-    mod_passed, mod_failed = run_mod_smoke_tests()
-
-    print_header("CHAINED REFACTORING TESTS")
-    chain_passed, chain_failed = run_chained_refactoring_tests(compilers)
+    # One scratch root for the whole run (tmpfs where available); each test gets a numbered
+    # subdirectory, and only the root is cleaned up, once, after every repo handle is closed
+    temp_dir_obj = tempfile.TemporaryDirectory(dir=COMPILE_TEMP_ROOT)
+    temp_root = Path(temp_dir_obj.name)
+    try:
+        print_header("MOD SMOKE TESTS")
+        mod_passed, mod_failed = run_mod_smoke_tests(temp_root)
+
+        print_header("CHAINED REFACTORING TESTS")
+        chain_passed, chain_failed = run_chained_refactoring_tests(compilers, temp_root)
+    finally:
+        try:
+            temp_dir_obj.cleanup()
+        except PermissionError:
+            # On Windows, if cleanup fails, warn but don't crash
+            print(f"\n  WARNING: Could not clean up temp directory: {temp_root}")
 
     # Print final summary
     total_passed = validator_passed + mod_passed + chain_passed
     total_failed = validator_failed + mod_failed + chain_failed
     total_tests = total_passed + total_failed
 
-    print("\n" + "=" * 60)
+    print("\n" + BAR60)
     print("FINAL TEST SUMMARY")
-    print("=" * 60)
+    print(BAR60)
     print(f"Validator tests:           {validator_passed:3d} passed, {validator_failed:3d} failed")
     print(f"Mod tests:                 {mod_passed:3d} passed, {mod_failed:3d} failed")
     print(f"Chained refactoring tests: {chain_passed:3d} passed, {chain_failed:3d} failed")
-    print("-" * 60)
+    print(DASH60)
     print(f"TOTAL:                     {total_passed:3d} passed, {total_failed:3d} failed ({total_tests} total)")
-    print("=" * 60)
+    print(BAR60)
 
     if total_failed == 0:
         print("\nAll tests PASSED!")
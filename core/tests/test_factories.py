@@ -6,7 +6,7 @@ from core.mods.replace_ms_specific_mod import ReplaceMSSpecificMod
 from core.validators.validator_factory import ValidatorFactory, ValidatorType
 from core.validators.asm_validator import ASMValidatorO0, ASMValidatorO3
 from core.compilers.compiler_type import CompilerType
-from core.compilers.compiler_factory import CompilerFactory, get_compiler
+from core.compilers.compiler_factory import CompilerFactory, get_compiler, reset_compiler, set_compiler
 from core.compilers.msvc_compiler import MSVCCompiler
 from core.compilers.clang_compiler import ClangCompiler
 
@@ -143,3 +143,20 @@ class TestCompilerFactory:
     def test_compiler_type_enum_has_msvc_and_clang(self):
         assert CompilerType.MSVC.value == 'msvc'
         assert CompilerType.CLANG.value == 'clang'
+
+    def test_get_compiler_reuses_instance_across_switches(self):
+        reset_compiler()
+        try:
+            with patch('core.compilers.compiler_factory.MSVCCompiler') as msvc, \
+                    patch('core.compilers.compiler_factory.ClangCompiler') as clang:
+                set_compiler('msvc')
+                first_msvc = get_compiler()
+                set_compiler('clang')
+                get_compiler()
+                set_compiler('msvc')
+                assert get_compiler() is first_msvc
+                assert msvc.call_count == 1
+                assert clang.call_count == 1
+        finally:
+            reset_compiler()
+            set_compiler('msvc')
@@ -0,0 +1,54 @@
+from pathlib import Path
+
+from core.smoketest import find_mock_symbol
+
+
+SOURCE = """inline int compute() {
+    return 42;
+}
+
+struct Point {
+    int getX() { return x; }
+    int getY() { return y; }
+};
+
+struct Derived : Base {
+    virtual int compute(int x);
+};
+
+int Derived::compute(int x) {
+    return x;
+}
+
+int Point::getZ() {
+    return 0;
+}
+"""
+
+
+class TestFindMockSymbol:
+    def test_free_function_resolves_to_first_declaration(self):
+        symbol = find_mock_symbol(SOURCE, "compute", Path("test.cpp"))
+
+        assert symbol.line_start == 1
+        assert symbol.prototype == "inline int compute() {"
+
+    def test_method_resolves_to_class_body(self):
+        symbol = find_mock_symbol(SOURCE, "Derived::compute", Path("test.cpp"))
+
+        assert symbol.line_start == 11
+        assert symbol.qualified_name == "Derived::compute"
+        assert symbol.prototype == "virtual int compute(int x);"
+
+    def test_method_in_class_with_inline_bodies(self):
+        symbol = find_mock_symbol(SOURCE, "Point::getY", Path("test.cpp"))
+
+        assert symbol.line_start == 7
+
+    def test_method_falls_back_to_out_of_line_definition(self):
+        symbol = find_mock_symbol(SOURCE, "Point::getZ", Path("test.cpp"))
+
+        assert symbol.line_start == 18
+
+    def test_missing_symbol_returns_none(self):
+        assert find_mock_symbol(SOURCE, "Point::missing", Path("test.cpp")) is None
@@ -443,6 +443,56 @@ class TestModProcessorProcessMod:
         assert result.status == ResultStatus.FAILED
 
 
+class TestModProcessorRepoLock:
+    @pytest.fixture
+    def processor(self, temp_dir):
+        # Locking needs no real toolchain, so these run where no compiler is installed
+        with patch("core.mod_processor.get_compiler"):
+            yield ModProcessor(repos_path=temp_dir / "repos")
+
+    @pytest.fixture
+    def builtin_mod_request(self):
+        mock_mod_instance = Mock()
+        mock_mod_instance.get_name.return_value = "Test Mod"
+        mock_mod_instance.generate_refactorings.return_value = iter([])
+        return ModRequest(
+            id="test-123",
+            repo_url="https://github.com/user/repo.git",
+            description="Test builtin mod",
+            mod_instance=mock_mod_instance
+        )
+
+    def test_repo_lock_is_shared_per_repo_url(self, processor):
+        lock = processor._get_repo_lock("https://github.com/user/repo.git")
+
+        assert processor._get_repo_lock("https://github.com/user/repo.git") is lock
+        assert processor._get_repo_lock("https://github.com/user/other.git") is not lock
+
+    @patch("core.mod_processor.Repo")
+    def test_process_mod_holds_repo_lock(
+        self, mock_repo_class, processor, builtin_mod_request
+    ):
+        lock = processor._get_repo_lock(builtin_mod_request.repo_url)
+        held = []
+        mock_repo_class.side_effect = lambda **kwargs: held.append(lock.locked()) or MagicMock()
+
+        processor.process_mod(builtin_mod_request)
+
+        assert held == [True]
+        assert not lock.locked()
+
+    @patch("core.mod_processor.Repo")
+    def test_on_start_runs_once_repo_lock_is_held(
+        self, mock_repo_class, processor, builtin_mod_request
+    ):
+        lock = processor._get_repo_lock(builtin_mod_request.repo_url)
+        started = []
+
+        processor.process_mod(builtin_mod_request, on_start=lambda: started.append(lock.locked()))
+
+        assert started == [True]
+
+
 class TestModProcessorTempFileCleanup:
     @patch("core.mod_processor.Repo")
     def test_error_on_compilation_exception(
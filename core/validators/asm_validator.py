@@ -9,21 +9,29 @@ from ..compilers.compiler_type import CompilerType
 class BaseASMValidator(BaseValidator, ABC):
     """Base class for ASM validators with shared comparison logic."""
 
-    def __init__(self):
-        # Pattern for COMDAT markers (inline functions that linker can discard)
-        self.comdat_pattern = re.compile(r'^\s*;\s*COMDAT\s+(\S+)')
-        # Pattern for identifiers to canonicalize within function bodies
-        self.identifier_pattern = re.compile(
-            r'(\?[\w@]+Z\b)|'     # Mangled names (e.g., ?func@@YAHXZ)
-            r'(\$LN\d+@\w+)|'     # Local labels with function (e.g., $LN3@func)
-            r'(\$LN\d+:?)|'       # Standalone local labels (e.g., $LN6, $LN6:)
-            r'(\$SG\d+)|'         # String/data labels (e.g., $SG1234)
-            r'(\.LBB\d+_\d+)|'    # Clang basic block labels (e.g., .LBB0_1, .LBB1_3)
-            r'(\.Ltmp\d+)|'       # Clang temp labels (e.g., .Ltmp0)
-            r'(\.L[A-Z]+\d+)'     # Other Clang labels (e.g., .LCPI0_0)
-        )
+    # Compiled once per process; validators are created per mod and per smoke test
+    # COMDAT markers (inline functions that linker can discard), matched over the whole listing
+    comdat_pattern = re.compile(r'^[^\S\n]*;[^\S\n]*COMDAT[^\S\n]+(\S+)', re.MULTILINE)
+    # Identifiers to canonicalize within function bodies
+    identifier_pattern = re.compile(
+        r'(\?[\w@]+Z\b)|'     # Mangled names (e.g., ?func@@YAHXZ)
+        r'(\$LN\d+@\w+)|'     # Local labels with function (e.g., $LN3@func)
+        r'(\$LN\d+:?)|'       # Standalone local labels (e.g., $LN6, $LN6:)
+        r'(\$SG\d+)|'         # String/data labels (e.g., $SG1234)
+        r'(\.LBB\d+_\d+)|'    # Clang basic block labels (e.g., .LBB0_1, .LBB1_3)
+        r'(\.Ltmp\d+)|'       # Clang temp labels (e.g., .Ltmp0)
+        r'(\.L[A-Z]+\d+)'     # Other Clang labels (e.g., .LCPI0_0)
+    )
+    # Lines inside a function body that are metadata rather than instructions
+    MSVC_METADATA_PREFIXES = ('_TEXT', 'pdata', 'xdata', 'CONST', 'DD ', 'DQ ')
+    CLANG_DIRECTIVE_PREFIXES = ('.seh_', '.def', '.scl', '.type', '.endef', '.p2align', '.file',
+                                '.intel_syntax', '@feat.00', '.L', '.cfi_')
 
     def validate(self, original: CompiledFile, modified: CompiledFile) -> bool:
+        # Identical listings match trivially; skip parsing them
+        if original.asm_output == modified.asm_output:
+            return True
+
         # Extract function bodies from both ASMs
         original_funcs = self._extract_functions(original.asm_output)
         modified_funcs = self._extract_functions(modified.asm_output)
@@ -64,28 +72,24 @@ class BaseASMValidator(BaseValidator, ABC):
         label_counter = 0
         data_counter = 0
 
-        normalized = []
-        for line in body:
-            # Normalize identifiers within the line
-            def replace_id(match):
-                nonlocal func_counter, label_counter, data_counter
-                identifier = match.group(0)
-                if identifier not in local_map:
-                    if identifier.startswith('?'):
-                        local_map[identifier] = f'F{func_counter}'
-                        func_counter += 1
-                    elif identifier.startswith('$LN') or identifier.startswith('.LBB') or identifier.startswith('.Ltmp'):
-                        local_map[identifier] = f'L{label_counter}'
-                        label_counter += 1
-                    elif identifier.startswith('$SG') or identifier.startswith('.L'):
-                        local_map[identifier] = f'D{data_counter}'
-                        data_counter += 1
-                return local_map.get(identifier, identifier)
-
-            normalized_line = self.identifier_pattern.sub(replace_id, line)
-            normalized.append(normalized_line)
-
-        return tuple(normalized)
+        # Normalize identifiers within each line
+        def replace_id(match):
+            nonlocal func_counter, label_counter, data_counter
+            identifier = match.group(0)
+            if identifier not in local_map:
+                if identifier.startswith('?'):
+                    local_map[identifier] = f'F{func_counter}'
+                    func_counter += 1
+                elif identifier.startswith(('$LN', '.LBB', '.Ltmp')):
+                    local_map[identifier] = f'L{label_counter}'
+                    label_counter += 1
+                elif identifier.startswith(('$SG', '.L')):
+                    local_map[identifier] = f'D{data_counter}'
+                    data_counter += 1
+            return local_map.get(identifier, identifier)
+
+        sub = self.identifier_pattern.sub
+        return tuple(sub(replace_id, line) for line in body)
 
     def _function_bodies_match(self, body1: list, body2: list) -> bool:
         """Check if two function bodies are functionally equivalent."""
@@ -98,12 +102,7 @@ class BaseASMValidator(BaseValidator, ABC):
         if not asm_content:
             return set()
 
-        comdat_functions = set()
-        for line in asm_content.splitlines():
-            match = self.comdat_pattern.match(line)
-            if match:
-                comdat_functions.add(match.group(1))
-        return comdat_functions
+        return set(self.comdat_pattern.findall(asm_content))
 
     def _detect_asm_format(self, asm_content: str) -> CompilerType | str:
         """Detect whether assembly is MSVC or Clang format.
@@ -181,7 +180,7 @@ class BaseASMValidator(BaseValidator, ABC):
             # Collect instructions inside function
             if current_func:
                 # Skip metadata lines
-                if any(line.startswith(p) for p in ['_TEXT', 'pdata', 'xdata', 'CONST', 'DD ', 'DQ ']):
+                if line.startswith(self.MSVC_METADATA_PREFIXES):
                     continue
                 # Skip local variable declarations like "x$ = 8"
                 if '$ =' in line:
@@ -255,7 +254,7 @@ class BaseASMValidator(BaseValidator, ABC):
                 continue
 
             # Detect function end/start markers
-            if line.startswith('.globl') or line.startswith('.addrsig'):
+            if line.startswith(('.globl', '.addrsig')):
                 # Save current function and reset
                 if current_func and current_body:
                     functions[current_func] = current_body
@@ -269,7 +268,7 @@ class BaseASMValidator(BaseValidator, ABC):
                 # Extract function name (remove colon and quotes)
                 func_name = line[:-1].strip().strip('"')
                 # Skip internal labels that start with .L
-                if not func_name.startswith('.L') and not func_name.startswith('.seh'):
+                if not func_name.startswith(('.L', '.seh')):
                     current_func = func_name
                     current_body = []
                 continue
@@ -278,9 +277,7 @@ class BaseASMValidator(BaseValidator, ABC):
             if current_func:
 
                 # Skip assembler directives and metadata
-                if any(line.startswith(p) for p in ['.seh_', '.def', '.scl', '.type', '.endef',
-                                                     '.p2align', '.file', '.intel_syntax',
-                                                     '@feat.00', '.L', '.cfi_']):
+                if line.startswith(self.CLANG_DIRECTIVE_PREFIXES):
                     continue
 
                 # Collect actual instructions
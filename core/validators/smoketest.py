@@ -2,9 +2,14 @@
 """Smoke tests for validators."""
 
 import argparse
+import hashlib
+import json
+import os
 import sys
-import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 
 # Add parent directories to path to support running from validators/ directory
 _file_path = Path(__file__).resolve()
@@ -13,13 +18,31 @@ _project_root = _core_path.parent
 sys.path.insert(0, str(_project_root))
 sys.path.insert(0, str(_core_path))
 
+from core.compilers.compiled_file import CompiledFile
 from core.compilers.compiler_type import CompilerType
 from core.compilers.compiler_factory import get_compiler, set_compiler
 from core.validators.asm_validator import ASMValidatorO0, ASMValidatorO3
 
 
+# Part of every test's translation unit, not a separately compiled object: the call to f()
+# is what makes the compiler emit f() and the inline functions it uses into the listing
 SCAFFOLD = "\nint main() { return f(); }"
 
+# Validators hold no per-run state, so every test at a level shares one instance
+VALIDATORS = {
+    0: ASMValidatorO0(),
+    3: ASMValidatorO3(),
+}
+
+
+def _convert_flags(flags, compiler_type):
+    """Convert flags for the given compiler (MSVC uses /D, Clang uses -D)."""
+    if flags is None:
+        return None
+    if compiler_type == CompilerType.CLANG:
+        return flags.replace('/D', '-D')
+    return flags
+
 
 class TestCase:
     """Test case for validators.
@@ -27,6 +50,9 @@ class TestCase:
     Contains source code before and after a transformation, along with the
     optimization level to use for compilation and validation.
     """
+    __slots__ = ('name', 'source', 'modified_source', 'optimization_level', 'validator',
+                 'additional_flags', 'modified_additional_flags', 'flags')
+
     def __init__(
         self,
         name: str,
@@ -49,12 +75,19 @@ class TestCase:
         self.source = source + SCAFFOLD
         self.modified_source = modified_source + SCAFFOLD
         self.optimization_level = o
+        self.validator = VALIDATORS[o]
         self.additional_flags = additional_flags
         self.modified_additional_flags = compiler_flags if compiler_flags is not None else additional_flags
+        # (original, modified) flags in each compiler's syntax, converted once here
+        self.flags = {
+            compiler_type: (_convert_flags(self.additional_flags, compiler_type),
+                            _convert_flags(self.modified_additional_flags, compiler_type))
+            for compiler_type in CompilerType
+        }
 
 
 SMOKE_TESTS = \
-[
+(
     # =============================================================================
     # Comments
     # =============================================================================
@@ -215,12 +248,6 @@ int f() {
     TestCase("remove_unused_var",   'int f() { int unused = 42; return 10; }',
                                     'int f() {                  return 10; }', o=3),
 
-    # =============================================================================
-    # REMOVE: unused variables
-    # =============================================================================
-    TestCase("remove_unused_var",   'int f() { int unused = 42; return 10; }',
-                                    'int f() {                  return 10; }', o=3),
-
     # =============================================================================
     # REMOVE: void argument list
     # =============================================================================
@@ -453,71 +480,208 @@ int f() {
              '#include <type_traits>\ntemplate<typename T> int process(T x) {\n#ifdef __cplusplus\n    return x + 1;\n#else\n    return x;\n#endif\n}\nint f() { return process(5); }',
              '#include <type_traits>\ntemplate<typename T> int process(T x) {\n    if constexpr (std::is_integral<T>::value) {\n        return x + 1;\n    } else {\n        return x;\n    }\n}\nint f() { return process(5); }', o=3),
 
-]
+)
 
+SMOKE_TESTS_BY_NAME = MappingProxyType({test.name: test for test in SMOKE_TESTS})
 
-def run_validator_smoke_tests(compilers):
-    total_passed = 0
-    total_failed = 0
 
-    for compiler_type in compilers:
-        print(f"\n{'=' * 60}")
-        print(f"Testing with compiler: {compiler_type.value}")
-        print('=' * 60)
+# Report banners
+BAR60 = "=" * 60
+DASH60 = "-" * 60
 
-        # Set compiler type
-        set_compiler(compiler_type.value)
+# Compiles are separate processes, so threads are enough to keep every core busy
+SMOKE_TEST_WORKERS = os.cpu_count() or 1
 
-        compiler = get_compiler()
-        print(f"Initialized compiler: {compiler.get_name()}")
 
-        validators = {
-            0: ASMValidatorO0(),
-            3: ASMValidatorO3(),
-        }
+# Compiled output is kept across runs, per compiler fingerprint. Entries are content-addressed,
+# so CI can point LEVELUP_CACHE_DIR at a directory it restores and saves between jobs.
+LEVELUP_CACHE_DIR = Path(os.environ.get('LEVELUP_CACHE_DIR')
+                         or Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'levelup')
+SMOKE_CACHE_DIR = LEVELUP_CACHE_DIR / 'smoketest'
 
-        for test in SMOKE_TESTS:
-            print(f"\nRunning: {test.name}")
+# Bump when the meaning of a cached entry changes, so older entries are never read
+# (2: batch compiles store each file's own warnings, not the whole batch's)
+CACHE_FORMAT = 2
 
-            validator = validators[test.optimization_level]
 
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
+class CompileCache:
+    """Memoizes one compiler's output by (source, flags, optimization level).
 
-                original_file = temp_path / "original.cpp"
-                modified_file = temp_path / "modified.cpp"
+    Many tests share a source (e.g. the _o0/_o3 variants), so each distinct input
+    is compiled once, even when several threads ask for it at the same time.
+    With a cache_dir, the ASM is also stored on disk under the compiler's
+    fingerprint, so unchanged tests are not recompiled on the next run.
+    """
 
-                original_file.write_text(test.source)
-                modified_file.write_text(test.modified_source)
+    def __init__(self, compiler, cache_dir: Path = None):
+        self.compiler = compiler
+        self._lock = threading.Lock()
+        self._compiled = {}
+        fingerprint = compiler.get_fingerprint() if cache_dir else None
+        self._disk_dir = cache_dir / f'v{CACHE_FORMAT}-{fingerprint}' if fingerprint else None
+
+    def compile(self, source: str, additional_flags: str, optimization_level: int):
+        key = (source, additional_flags, optimization_level)
+        with self._lock:
+            future = self._compiled.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = self._compiled[key] = Future()
+
+        if is_owner:
+            self._compile_batch([key], additional_flags, optimization_level)
+        return future.result()
+
+    def prefetch(self, executor, keys, batches: int):
+        """Start compiling every (source, flags, level) key not yet cached.
+
+        Keys sharing flags and level are split into up to `batches` compile_sources()
+        calls, so compilers with a costly startup run once per batch, not per file.
+        """
+        groups = {}
+        with self._lock:
+            for key in keys:
+                if key not in self._compiled:
+                    self._compiled[key] = Future()
+                    groups.setdefault(key[1:], []).append(key)
+
+        for (additional_flags, optimization_level), group in groups.items():
+            size = -(-len(group) // batches)
+            for start in range(0, len(group), size):
+                executor.submit(self._compile_batch, group[start:start + size],
+                                additional_flags, optimization_level)
+
+    def _compile_batch(self, keys, additional_flags, optimization_level):
+        # Runs on the executor, whose futures nobody reads: any error must reach the key futures,
+        # or every compile() waiting on them would block forever
+        error = None
+        try:
+            missing = []
+            for key in keys:
+                compiled = self._load(key)
+                if compiled is None:
+                    missing.append(key)
+                else:
+                    self._compiled[key].set_result(compiled)
+
+            if missing:
+                try:
+                    compiled = self.compiler.compile_sources(
+                        [key[0] for key in missing],
+                        additional_flags=additional_flags,
+                        optimization_level=optimization_level
+                    )
+                    if len(compiled) != len(missing):
+                        raise RuntimeError(f"compile_sources returned {len(compiled)} results for {len(missing)} sources")
+                except Exception:
+                    if len(missing) == 1:
+                        raise
+                    # One bad source fails the whole batch; compile each on its own so only it fails
+                    for key in missing:
+                        self._compile_one(key, additional_flags, optimization_level)
+                else:
+                    for key, result in zip(missing, compiled):
+                        self._store(key, result)
+                        self._compiled[key].set_result(result)
+        except Exception as e:
+            error = e
+        finally:
+            for key in keys:
+                future = self._compiled[key]
+                if not future.done():
+                    future.set_exception(error or RuntimeError("Compile was interrupted"))
+
+    def _compile_one(self, key, additional_flags, optimization_level):
+        try:
+            result = self.compiler.compile_source(
+                key[0], additional_flags=additional_flags, optimization_level=optimization_level
+            )
+        except Exception as e:
+            self._compiled[key].set_exception(e)
+            return
+        self._store(key, result)
+        self._compiled[key].set_result(result)
+
+    def _disk_path(self, key) -> Path:
+        return self._disk_dir / f"{hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()}.json"
+
+    def _load(self, key):
+        if self._disk_dir is None:
+            return None
+        try:
+            entry = json.loads(self._disk_path(key).read_bytes())
+            asm_output, warnings = entry['asm_output'], entry['warnings']
+        except (OSError, ValueError, KeyError, TypeError):
+            return None  # Missing, unreadable or malformed entries are misses; _store() rewrites them
+        if not isinstance(asm_output, str) or not isinstance(warnings, (str, type(None))):
+            return None
+        return CompiledFile(source_file=Path('-'), asm_output=asm_output, warnings=warnings)
+
+    def _store(self, key, compiled):
+        if self._disk_dir is None or compiled.asm_output is None:
+            return
+        path = self._disk_path(key)
+        # Write then rename, so a concurrent or interrupted run never reads a partial entry
+        temp_file = path.with_suffix(f'.{threading.get_ident()}.tmp')
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_file.write_text(json.dumps({'asm_output': compiled.asm_output, 'warnings': compiled.warnings}))
+            os.replace(temp_file, path)
+        except OSError:
+            pass  # The cache is an optimization; an unwritable cache dir must not fail the run
+
+
+def _check(validator, original_compiled, modified_compiled):
+    """Validate one test case's compiled output.
+
+    Returns (passed, report) so that output can be printed in test order.
+    """
+    if validator.validate(original_compiled, modified_compiled):
+        return True, "  PASS"
+    return False, (
+        f"  FAIL - validator returned False (expected True)\n"
+        f"  Original ASM:\n{original_compiled.asm_output}\n"
+        f"  Modified ASM:\n{modified_compiled.asm_output}"
+    )
 
-                # Convert flags for current compiler (MSVC uses /D, Clang uses -D)
-                def convert_flags(flags):
-                    if flags is None:
-                        return None
-                    if compiler_type == CompilerType.CLANG:
-                        return flags.replace('/D', '-D')
-                    return flags
 
-                original_compiled = compiler.compile_file(
-                    original_file,
-                    additional_flags=convert_flags(test.additional_flags),
-                    optimization_level=test.optimization_level
-                )
-                modified_compiled = compiler.compile_file(
-                    modified_file,
-                    additional_flags=convert_flags(test.modified_additional_flags),
-                    optimization_level=test.optimization_level
-                )
+def run_validator_smoke_tests(compilers):
+    total_passed = 0
+    total_failed = 0
 
-                result = validator.validate(original_compiled, modified_compiled)
+    with ThreadPoolExecutor(max_workers=SMOKE_TEST_WORKERS) as executor:
+        for compiler_type in compilers:
+            print("\n" + BAR60)
+            print(f"Testing with compiler: {compiler_type.value}")
+            print(BAR60)
 
-                if result:
-                    print(f"  PASS")
+            # Set compiler type
+            set_compiler(compiler_type.value)
+
+            compiler = get_compiler()
+            print(f"Initialized compiler: {compiler.get_name()}")
+
+            # Submit every compile up front, then validate each test once both halves are done
+            cache = CompileCache(compiler, SMOKE_CACHE_DIR)
+            keys = [
+                (
+                    (test.source, test.flags[compiler_type][0], test.optimization_level),
+                    (test.modified_source, test.flags[compiler_type][1], test.optimization_level),
+                )
+                for test in SMOKE_TESTS
+            ]
+            cache.prefetch(executor, [key for pair in keys for key in pair], SMOKE_TEST_WORKERS)
+
+            # One write per test: the header is printed together with its report
+            for test, (original, modified) in zip(SMOKE_TESTS, keys):
+                try:
+                    passed, report = _check(test.validator, cache.compile(*original), cache.compile(*modified))
+                except Exception as e:
+                    passed, report = False, f"  FAIL - compilation failed: {e}"
+                print(f"\nRunning: {test.name}\n{report}")
+                if passed:
                     total_passed += 1
                 else:
-                    print(f"  FAIL - validator returned False (expected True)")
-                    print(f"  Original ASM:\n{original_compiled.asm_output}")
-                    print(f"  Modified ASM:\n{modified_compiled.asm_output}")
                     total_failed += 1
 
     return total_passed, total_failed
@@ -530,13 +694,13 @@ def get_default_compiler():
 
 def print_summary(total_passed, total_failed):
     total_tests = total_passed + total_failed
-    print("\n" + "=" * 60)
+    print("\n" + BAR60)
     print("VALIDATOR TEST SUMMARY")
-    print("=" * 60)
+    print(BAR60)
     print(f"Validator tests: {total_passed:3d} passed, {total_failed:3d} failed")
-    print("-" * 60)
+    print(DASH60)
     print(f"TOTAL:           {total_passed:3d} passed, {total_failed:3d} failed ({total_tests} total)")
-    print("=" * 60)
+    print(BAR60)
 
     if total_failed == 0:
         print("\nAll tests PASSED!")
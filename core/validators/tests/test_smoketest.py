@@ -0,0 +1,92 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from core.compilers.compiled_file import CompiledFile
+from core.validators import smoketest
+
+
+def _mock_compiler(fingerprint="fp"):
+    compiler = Mock()
+    compiler.get_fingerprint.return_value = fingerprint
+    compiler.compile_sources.side_effect = lambda sources, **kwargs: [
+        CompiledFile(source_file="-", asm_output=f"asm for {source}") for source in sources
+    ]
+    return compiler
+
+
+class TestSmokeTests:
+    def test_names_are_unique(self):
+        assert len(smoketest.SMOKE_TESTS_BY_NAME) == len(smoketest.SMOKE_TESTS)
+
+
+class TestCompileCache:
+    def test_same_input_is_compiled_once(self):
+        compiler = _mock_compiler()
+        cache = smoketest.CompileCache(compiler)
+
+        first = cache.compile("int f();", None, 0)
+        second = cache.compile("int f();", None, 0)
+
+        assert first is second
+        assert compiler.compile_sources.call_count == 1
+
+    def test_output_is_reused_from_disk_across_caches(self, temp_dir):
+        smoketest.CompileCache(_mock_compiler(), temp_dir).compile("int f();", None, 3)
+
+        compiler = _mock_compiler()
+        compiled = smoketest.CompileCache(compiler, temp_dir).compile("int f();", None, 3)
+
+        assert compiled.asm_output == "asm for int f();"
+        compiler.compile_sources.assert_not_called()
+
+    def test_new_fingerprint_misses_disk_cache(self, temp_dir):
+        smoketest.CompileCache(_mock_compiler("old"), temp_dir).compile("int f();", None, 3)
+
+        compiler = _mock_compiler("new")
+        smoketest.CompileCache(compiler, temp_dir).compile("int f();", None, 3)
+
+        assert compiler.compile_sources.call_count == 1
+
+    @pytest.mark.parametrize("entry", ['[]', '{"asm_output": "asm"}', '{"asm_output": 1, "warnings": null}'])
+    def test_malformed_disk_entry_is_a_miss(self, temp_dir, entry):
+        cache = smoketest.CompileCache(_mock_compiler(), temp_dir)
+        path = cache._disk_path(("int f();", None, 3))
+        path.parent.mkdir(parents=True)
+        path.write_text(entry)
+
+        compiled = cache.compile("int f();", None, 3)
+
+        assert compiled.asm_output == "asm for int f();"
+        assert cache.compiler.compile_sources.call_count == 1
+
+    def test_short_batch_result_fails_instead_of_hanging(self):
+        compiler = _mock_compiler()
+        compiler.compile_sources.side_effect = lambda sources, **kwargs: []
+        compiler.compile_source.side_effect = RuntimeError("Compilation failed")
+        cache = smoketest.CompileCache(compiler)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            cache.prefetch(executor, [("int f();", None, 0), ("int g();", None, 0)], 1)
+
+            with pytest.raises(RuntimeError):
+                cache.compile("int g();", None, 0)
+
+    def test_bad_source_fails_only_its_own_key(self):
+        def compile_source(source, **kwargs):
+            if "bad" in source:
+                raise RuntimeError("Compilation failed")
+            return CompiledFile(source_file="-", asm_output=f"asm for {source}")
+
+        compiler = _mock_compiler()
+        compiler.compile_sources.side_effect = RuntimeError("Compilation failed")
+        compiler.compile_source.side_effect = compile_source
+        cache = smoketest.CompileCache(compiler)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            cache.prefetch(executor, [("int good();", None, 0), ("int bad();", None, 0)], 1)
+
+            assert cache.compile("int good();", None, 0).asm_output == "asm for int good();"
+            with pytest.raises(RuntimeError):
+                cache.compile("int bad();", None, 0)
@@ -31,3 +31,13 @@ class TestASMValidatorO3Basics:
     def test_can_be_constructed(self):
         validator = ASMValidatorO3()
         assert validator is not None
+
+
+class TestASMValidatorIdenticalOutput:
+    def test_identical_asm_skips_function_extraction(self):
+        validator = ASMValidatorO0()
+        validator._extract_functions = Mock()
+        asm = "?f@@YAHXZ PROC\n    mov eax, 17\n    ret 0\n?f@@YAHXZ ENDP\n"
+
+        assert validator.validate(Mock(asm_output=asm), Mock(asm_output=asm)) is True
+        validator._extract_functions.assert_not_called()
@@ -11,4 +11,5 @@ from server.app import app
 set_compiler('msvc')
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # The reloader would import server.app twice, starting a second set of mod workers
+    app.run(debug=True, host='0.0.0.0', port=5000, use_reloader=False, threaded=True)
@@ -3,17 +3,24 @@ LevelUp Server - Modernize legacy C++ code with zero regression risk
 """
 
 import os
-import json
 import asyncio
+import atexit
+import collections
+import concurrent.futures
+import functools
+import itertools
+import hashlib
 import threading
-import queue
 import subprocess
 import tempfile
 import shutil
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
-from flask import Flask, render_template, request, jsonify, session
+from flask import Flask, render_template, request, jsonify, session, Response, send_file, stream_with_context
+import orjson
 import uuid
+import weakref
 from typing import Dict
 
 from core.compilers.compiler_factory import CompilerFactory
@@ -23,20 +30,111 @@ from core.result import Result, ResultStatus
 from core.repo import Repo
 from core.mod_request import ModRequest
 from core.mod_processor import ModProcessor
-from core.parsers import DoxygenRunner
+from core.parsers import DoxygenRunner, SymbolKind
 from core import logger
 from core.tool_config import ToolConfig
 
+class DoxygenStatusTable:
+    """Thread-safe Doxygen generation status per repo, with completion events for long-polling."""
+
+    TERMINAL_STATUSES = ('completed', 'failed', 'skipped')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._statuses: Dict[str, dict] = {}
+        self._events: Dict[str, threading.Event] = {}
+        self.version = 0  # Bumped on every change; used as an ETag
+
+    def set(self, repo_id: str, status: str, message: str, **extra):
+        with self._lock:
+            self._statuses[repo_id] = {'status': status, 'message': message, **extra}
+            self.version += 1
+            event = self._events.setdefault(repo_id, threading.Event())
+            if status in self.TERMINAL_STATUSES:
+                event.set()
+            else:
+                event.clear()
+
+    def get(self, repo_id: str):
+        """Return a copy of the status dict for repo_id, or None if generation was never started."""
+        with self._lock:
+            status = self._statuses.get(repo_id)
+            return dict(status) if status is not None else None
+
+    def is_completed(self, repo_id: str) -> bool:
+        with self._lock:
+            return self._statuses.get(repo_id, {}).get('status') == 'completed'
+
+    def long_poll(self, repo_id: str, timeout: float):
+        """Wait up to timeout seconds for generation to finish, then return the current status."""
+        with self._lock:
+            event = self._events.get(repo_id)
+        if event is not None:
+            event.wait(timeout)
+        return self.get(repo_id)
+
+
 # Track Doxygen generation status per repo
-doxygen_status: Dict[str, dict] = {}
+DOXYGEN_STATUS = DoxygenStatusTable()
 
 app = Flask(__name__)
 app.secret_key = 'levelup-secret-key-change-in-production'
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 
-# Global queue for async processing
-mod_queue = queue.Queue()
-results: Dict[str, Result] = {}  # Store results by mod_id
+# Global queue for async processing. Request threads append and notify under _mod_condition;
+# each mod_worker takes the oldest mod whose repo no other worker is processing.
+_mod_deque = collections.deque()
+_mod_condition = threading.Condition()
+_busy_repo_urls = set()  # Repos a worker is processing; guarded by _mod_condition
+MOD_WORKERS = min(8, os.cpu_count() or 1)
+
+
+class BoundedDict(collections.OrderedDict):
+    """Thread-safe dict that evicts its oldest entries once it holds more than maxsize."""
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+        self._lock = threading.RLock()
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            if len(self) > self.maxsize:
+                self.popitem(last=False)
+
+    def items_snapshot(self) -> list:
+        """Copy of items() that is safe to iterate while other threads insert."""
+        with self._lock:
+            return list(self.items())
+
+
+MAX_RESULTS = 10000
+results: Dict[str, Result] = BoundedDict(MAX_RESULTS)  # Store results by mod_id, oldest evicted first
+_active_mod_ids: Dict[str, None] = {}  # Mods that are queued or processing, in submission order
+TERMINAL_RESULT_STATUSES = frozenset((
+    ResultStatus.SUCCESS, ResultStatus.PARTIAL, ResultStatus.FAILED, ResultStatus.ERROR,
+))
+# Encoded to_dict() of finished results, which never change again; entries go away with their Result
+_result_bytes = weakref.WeakKeyDictionary()
+
+
+class _Version:
+    """Change counter for data without its own lock; used as an ETag."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0
+
+    def bump(self):
+        with self._lock:
+            self.value += 1
+
+
+results_version = _Version()
+
+# Counter ETags restart at 0 with the process; this token keeps tags from an earlier run from matching
+ETAG_EPOCH = uuid.uuid4().hex[:8]
 
 # Configuration
 tool_config = ToolConfig()
@@ -47,62 +145,274 @@ CONFIG = {
     'git_path': tool_config.git_path,
     'doxygen_path': tool_config.doxygen_path,
 }
+REPOS_JSON = CONFIG['workspace'] / 'repos.json'
 
 # Ensure workspace directories exist
 for path in CONFIG.values():
     if isinstance(path, Path):
         path.mkdir(parents=True, exist_ok=True)
 
-def mod_worker():
+
+def _atomic_write_json(path: Path, obj):
+    tmp = path.with_suffix('.tmp')
+    tmp.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    os.replace(tmp, path)
+
+
+class _RepoConfigStore:
+    """
+    In-memory view of repos.json.
+
+    Mutations happen under a lock so concurrent requests cannot lose each other's
+    changes. Disk writes are coalesced by a short timer and land atomically.
+    Edits made to the file outside the server are picked up by an mtime check.
+    """
+
+    FLUSH_DELAY = 1.0  # seconds; pending changes are also flushed at exit
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._configs = None
+        self._by_id: Dict[str, dict] = {}
+        self._mtime = None  # st_mtime_ns of the file as last read or written
+        self._flush_timer = None
+        self.version = 0  # Bumped on every change; used as an ETag
+
+    def load(self) -> list:
+        with self._lock:
+            return list(self._get_configs())
+
+    def current_version(self) -> int:
+        """Return version after picking up any edit made to the file; use this for ETags."""
+        with self._lock:
+            self._get_configs()
+            return self.version
+
+    def get(self, repo_id: str):
+        """Return the config for repo_id, or None if not found."""
+        with self._lock:
+            self._get_configs()
+            return self._by_id.get(repo_id)
+
+    def add(self, repo_config: dict):
+        with self._lock:
+            self._get_configs().append(repo_config)
+            self._by_id[repo_config['id']] = repo_config
+            self._schedule_flush()
+
+    def remove(self, repo_id: str) -> bool:
+        with self._lock:
+            configs = self._get_configs()
+            repo_config = self._by_id.pop(repo_id, None)
+            if repo_config is None:
+                return False
+            configs.remove(repo_config)
+            self._schedule_flush()
+            return True
+
+    def update(self, repo_id: str, changes: dict):
+        """Apply changes to a repo config. Returns the updated config, or None if not found."""
+        with self._lock:
+            self._get_configs()
+            repo_config = self._by_id.get(repo_id)
+            if repo_config is not None:
+                repo_config.update(changes)
+                self._schedule_flush()
+            return repo_config
+
+    def _get_configs(self) -> list:
+        # While a flush is pending, memory is newer than the file
+        if self._configs is not None and self._flush_timer is not None:
+            return self._configs
+
+        try:
+            mtime = self.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if self._configs is None or mtime != self._mtime:
+            try:
+                self._configs = orjson.loads(self.path.read_bytes())
+            except FileNotFoundError:
+                self._configs = []
+            self._by_id = {r['id']: r for r in self._configs}
+            self._mtime = mtime
+            self.version += 1
+        return self._configs
+
+    def _schedule_flush(self):
+        self.version += 1
+        # Keep a pending timer rather than restarting it, so steady edits cannot postpone the write forever
+        if self._flush_timer is None:
+            self._start_flush_timer()
+
+    def _start_flush_timer(self):
+        self._flush_timer = threading.Timer(self.FLUSH_DELAY, self._flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def flush(self):
+        """Write pending changes now instead of waiting for the timer."""
+        with self._lock:
+            if self._flush_timer is None:
+                return
+            self._flush_timer.cancel()
+        self._flush()
+
+    def _flush(self):
+        with self._lock:
+            if self._flush_timer is None:
+                return  # Already written by flush() or an earlier timer
+            try:
+                _atomic_write_json(self.path, self._configs)
+                mtime = self.path.stat().st_mtime_ns
+            except Exception:
+                # Changes stay pending: retry later, and flush() at exit still sees them
+                logger.exception("Failed to write %s; retrying in %ss", self.path, self.FLUSH_DELAY)
+                self._start_flush_timer()
+                return
+            self._flush_timer = None
+            self._mtime = mtime
+
+
+REPO_STORE = _RepoConfigStore(REPOS_JSON)
+atexit.register(REPO_STORE.flush)
+
+# Shared Repo instances, so cached Doxygen parsers survive across requests
+_repo_registry: Dict[str, Repo] = {}
+_repo_registry_lock = threading.Lock()
+
+
+def _get_repo(repo_id: str):
+    """Return the shared Repo for repo_id, or None if no such repo is configured."""
+    with _repo_registry_lock:
+        repo = _repo_registry.get(repo_id)
+        if repo is None:
+            repo_config = REPO_STORE.get(repo_id)
+            if repo_config is None:
+                return None
+            repo = Repo.from_config(repo_config, CONFIG['repos'], CONFIG['git_path'])
+            _repo_registry[repo_id] = repo
+        return repo
+
+
+def _invalidate_repo(repo_id: str):
+    with _repo_registry_lock:
+        _repo_registry.pop(repo_id, None)
+    # Parser ids of the dropped Repo may be reused by new objects
+    _filtered_symbols_bytes.cache_clear()
+
+def _claim_mod_request() -> ModRequest:
+    """
+    Block until a queued mod's repo is free, then mark that repo busy and return the mod.
+
+    Mods on a busy repo stay queued, in order, rather than tying up a worker,
+    so mods on other repos never wait behind them.
+    """
+    with _mod_condition:
+        while True:
+            for index, mod_request in enumerate(_mod_deque):
+                if mod_request.repo_url not in _busy_repo_urls:
+                    del _mod_deque[index]
+                    _busy_repo_urls.add(mod_request.repo_url)
+                    return mod_request
+            _mod_condition.wait()
+
+
+def _release_repo(repo_url: str):
+    with _mod_condition:
+        _busy_repo_urls.discard(repo_url)
+        _mod_condition.notify()
+
+
+def _mark_processing(mod_id: str):
+    results[mod_id] = Result(
+        status=ResultStatus.PROCESSING,
+        message='Starting mod processing...'
+    )
+    results_version.bump()
+
+
+def mod_worker(processor: ModProcessor):
     """Worker thread for processing mods"""
-    logger.info("mod_worker starting")
-    print("=== mod_worker starting ===")
+    while True:
+        mod_request = _claim_mod_request()
+        try:
+            logger.info("Dequeued mod for processing: %s", mod_request.id)
+
+            # Status turns PROCESSING only once ModProcessor holds the repo lock
+            result = processor.process_mod(
+                mod_request, on_start=functools.partial(_mark_processing, mod_request.id)
+            )
+            logger.info("Mod %s result: %s - %s", mod_request.id, result.status, result.message)
+
+            # Update results with returned result
+            results[mod_request.id] = result
+            results_version.bump()
+        except Exception as e:
+            logger.exception("Error in mod worker: %s", e)
+            # Give the mod a terminal status rather than leaving it PROCESSING forever
+            results[mod_request.id] = Result(status=ResultStatus.ERROR, message=str(e))
+            results_version.bump()
+        finally:
+            _active_mod_ids.pop(mod_request.id, None)
+            _release_repo(mod_request.repo_url)
+
+
+def start_mod_workers():
+    """Build the shared ModProcessor, then start the worker pool that uses it"""
+    logger.info("mod workers starting")
     try:
         processor = ModProcessor(
             repos_path=CONFIG['repos'],
             git_path=CONFIG['git_path']
         )
         logger.info("ModProcessor initialized successfully")
-        print("=== ModProcessor initialized ===")
     except Exception as e:
-        logger.exception(f"Error initializing ModProcessor: {e}")
-        print(f"=== Error initializing ModProcessor: {e} ===")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error initializing ModProcessor: %s", e)
         return
 
-    while True:
-        try:
-            mod_request = mod_queue.get(timeout=1)
-            logger.info(f"Dequeued mod for processing: {mod_request.id}")
-            print(f"=== Processing mod: {mod_request.id} ===")
-
-            # Set initial processing status
-            results[mod_request.id] = Result(
-                status=ResultStatus.PROCESSING,
-                message='Starting mod processing...'
-            )
+    # Mods are dominated by git and compiler subprocesses, which release the GIL
+    for _ in range(MOD_WORKERS):
+        threading.Thread(target=mod_worker, args=(processor,), daemon=True).start()
 
-            # Process mod and get result
-            result = processor.process_mod(mod_request)
-            logger.info(f"Mod {mod_request.id} result: {result.status} - {result.message}")
-            print(f"=== Mod result: {result.status} - {result.message} ===")
+# Compiler discovery can be slow (vcvars), so do it off the import path
+threading.Thread(target=start_mod_workers, daemon=True).start()
 
-            # Update results with returned result
-            results[mod_request.id] = result
+def _json_response(obj, status: int = 200):
+    """orjson-encoded replacement for jsonify on endpoints with large or frequent payloads."""
+    return app.response_class(orjson.dumps(obj), status=status, mimetype='application/json')
 
-            mod_queue.task_done()
-        except queue.Empty:
-            continue
-        except Exception as e:
-            logger.exception(f"Error in mod worker: {e}")
-            print(f"Error in mod worker: {e}")
-            import traceback
-            traceback.print_exc()
 
-# Start worker thread
-worker_thread = threading.Thread(target=mod_worker, daemon=True)
-worker_thread.start()
+def _conditional(etag: str, build):
+    """Answer 304 if the client already holds etag; otherwise call build() and tag the response."""
+    if request.if_none_match.contains(etag):
+        return Response(status=304)
+    response = build()
+    response.set_etag(etag)
+    return response
+
+
+def _static_json(payload):
+    """Serialize a payload that never changes while the server runs, with its ETag."""
+    body = orjson.dumps(payload)
+    return body, hashlib.blake2b(body, digest_size=8).hexdigest()
+
+
+_AVAILABLE_MODS = _static_json(ModFactory.get_available_mods())
+_AVAILABLE_VALIDATORS = _static_json(ValidatorFactory.get_available_validators())
+_AVAILABLE_COMPILERS = _static_json(CompilerFactory.get_available_compilers())
+
+
+STATIC_MAX_AGE = 300  # seconds; these listings only change on restart
+
+
+def _static_response(static):
+    body, etag = static
+    response = _conditional(etag, lambda: app.response_class(body, mimetype='application/json'))
+    response.headers['Cache-Control'] = f'public, max-age={STATIC_MAX_AGE}'
+    return response
+
 
 @app.route('/')
 def index():
@@ -118,130 +428,123 @@ def manage_repos():
         repo_name = Repo.get_repo_name(data['url'])
 
         repo_config = {
-            'id': str(uuid.uuid4()),
+            'id': uuid.uuid4().hex,
             'name': repo_name,
             'url': data['url'],
             'post_checkout': data.get('post_checkout', ''),
             'build_command': data.get('build_command', ''),
             'single_tu_command': data.get('single_tu_command', ''),
-            'timestamp': datetime.now().isoformat()
+            'timestamp': datetime.now().isoformat(timespec='seconds')
         }
         
-        # Store repo configuration
-        config_file = CONFIG['workspace'] / 'repos.json'
-        configs = []
-        if config_file.exists():
-            with open(config_file, 'r') as f:
-                configs = json.load(f)
-        configs.append(repo_config)
-        
-        with open(config_file, 'w') as f:
-            json.dump(configs, f, indent=2)
-
-        # Start Doxygen generation in background thread
-        thread = threading.Thread(
-            target=generate_doxygen_for_repo,
-            args=(repo_config,),
-            daemon=True
-        )
-        thread.start()
-        logger.info(f"Started Doxygen generation for new repo: {repo_name}")
+        REPO_STORE.add(repo_config)
+
+        # Start Doxygen generation in the background
+        _submit_doxygen(repo_config)
+        logger.info("Started Doxygen generation for new repo: %s", repo_name)
 
         return jsonify(repo_config)
 
     else:
-        config_file = CONFIG['workspace'] / 'repos.json'
-        if config_file.exists():
-            with open(config_file, 'r') as f:
-                return jsonify(json.load(f))
-        return jsonify([])
+        return _conditional(f'repos-{ETAG_EPOCH}-{REPO_STORE.current_version()}', lambda: jsonify(REPO_STORE.load()))
 
 @app.route('/api/repos/<repo_id>', methods=['DELETE'])
 def delete_repo(repo_id):
     """Delete a repository configuration"""
-    config_file = CONFIG['workspace'] / 'repos.json'
-    if config_file.exists():
-        with open(config_file, 'r') as f:
-            configs = json.load(f)
+    if REPO_STORE.remove(repo_id):
+        _invalidate_repo(repo_id)
+        return jsonify({'success': True})
+    return jsonify({'success': False}), 404
 
-        # Filter out the repo with matching ID
-        configs = [repo for repo in configs if repo['id'] != repo_id]
+@functools.lru_cache(maxsize=1)
+def _doxygen_available() -> bool:
+    """Probe for Doxygen once; cleared by /api/available/doxygen/refresh."""
+    return DoxygenRunner(doxygen_path=CONFIG['doxygen_path']).is_available()
 
-        with open(config_file, 'w') as f:
-            json.dump(configs, f, indent=2)
 
-        return jsonify({'success': True})
-    return jsonify({'success': False}), 404
+_doxygen_running = set()  # Repo ids with generation in progress
+_doxygen_running_lock = threading.Lock()
+
 
 def generate_doxygen_for_repo(repo_config: dict):
     """Background task to generate Doxygen data for a repository."""
+    repo_id = repo_config['id']
+    with _doxygen_running_lock:
+        # Two doxygen runs on one repo would write into the same output directory
+        if repo_id in _doxygen_running:
+            logger.warning("Doxygen generation already running for %s", repo_id)
+            return
+        _doxygen_running.add(repo_id)
+    try:
+        _generate_doxygen(repo_config)
+    finally:
+        with _doxygen_running_lock:
+            _doxygen_running.discard(repo_id)
+
+
+def _generate_doxygen(repo_config: dict):
     repo_id = repo_config['id']
     repo_name = repo_config['name']
 
-    doxygen_status[repo_id] = {
-        'status': 'running',
-        'message': f'Generating Doxygen data for {repo_name}...'
-    }
+    DOXYGEN_STATUS.set(repo_id, 'running', f'Generating Doxygen data for {repo_name}...')
 
     try:
         # Check if Doxygen is available
-        runner = DoxygenRunner(doxygen_path=CONFIG['doxygen_path'])
-        if not runner.is_available():
-            doxygen_status[repo_id] = {
-                'status': 'skipped',
-                'message': 'Doxygen not found on system. Function dependency data will not be available.'
-            }
-            logger.warning(f"Doxygen not available, skipping for repo {repo_name}")
+        if not _doxygen_available():
+            DOXYGEN_STATUS.set(repo_id, 'skipped',
+                               'Doxygen not found on system. Function dependency data will not be available.')
+            logger.warning("Doxygen not available, skipping for repo %s", repo_name)
             return
 
-        # Create Repo instance and ensure it's cloned
-        repo = Repo(
-            url=repo_config['url'],
-            repos_folder=CONFIG['repos'],
-            git_path=CONFIG['git_path'],
-            post_checkout=repo_config.get('post_checkout', '')
-        )
+        repo = _get_repo(repo_id)
+        if repo is None:
+            raise ValueError(f"Repository {repo_id} was removed")
         repo.ensure_cloned()
 
         # Generate Doxygen
         xml_dir = repo.generate_doxygen(doxygen_path=CONFIG['doxygen_path'])
+        _filtered_symbols_bytes.cache_clear()
+        _write_json_snapshots(repo)
 
-        doxygen_status[repo_id] = {
-            'status': 'completed',
-            'message': f'Doxygen data generated successfully',
-            'xml_dir': str(xml_dir)
-        }
-        logger.info(f"Doxygen generation completed for {repo_name}")
+        DOXYGEN_STATUS.set(repo_id, 'completed', 'Doxygen data generated successfully', xml_dir=str(xml_dir))
+        logger.info("Doxygen generation completed for %s", repo_name)
 
     except Exception as e:
-        doxygen_status[repo_id] = {
-            'status': 'failed',
-            'message': f'Doxygen generation failed: {str(e)}'
-        }
-        logger.exception(f"Doxygen generation failed for {repo_name}: {e}")
+        DOXYGEN_STATUS.set(repo_id, 'failed', f'Doxygen generation failed: {str(e)}')
+        logger.exception("Doxygen generation failed for %s: %s", repo_name, e)
+
+
+# Bounded pool so a burst of requests cannot start a herd of doxygen processes
+_DOXYGEN_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix='doxygen')
+_doxygen_futures: Dict[str, concurrent.futures.Future] = {}
+_doxygen_futures_lock = threading.Lock()
+
+
+def _submit_doxygen(repo_config: dict) -> bool:
+    """Queue Doxygen generation for a repo. Returns False if one is already queued or running."""
+    repo_id = repo_config['id']
+    with _doxygen_futures_lock:
+        future = _doxygen_futures.get(repo_id)
+        if future is not None and not future.done():
+            return False
+        DOXYGEN_STATUS.set(repo_id, 'queued', f'Doxygen generation queued for {repo_config["name"]}')
+        _doxygen_futures[repo_id] = _DOXYGEN_POOL.submit(generate_doxygen_for_repo, repo_config)
+        return True
 
 
 @app.route('/api/repos/<repo_id>/doxygen', methods=['POST'])
 def regenerate_doxygen(repo_id):
     """Regenerate Doxygen data for a repository."""
-    config_file = CONFIG['workspace'] / 'repos.json'
-    if not config_file.exists():
-        return jsonify({'error': 'No repositories found'}), 404
-
-    with open(config_file, 'r') as f:
-        configs = json.load(f)
-
-    repo_config = next((r for r in configs if r['id'] == repo_id), None)
+    repo_config = REPO_STORE.get(repo_id)
     if repo_config is None:
         return jsonify({'error': 'Repository not found'}), 404
 
-    # Start Doxygen generation in background thread
-    thread = threading.Thread(
-        target=generate_doxygen_for_repo,
-        args=(repo_config,),
-        daemon=True
-    )
-    thread.start()
+    # Start Doxygen generation in the background
+    if not _submit_doxygen(repo_config):
+        return jsonify({
+            'status': 'already_running',
+            'message': f'Doxygen generation already in progress for {repo_config["name"]}'
+        }), 409
 
     return jsonify({
         'status': 'started',
@@ -251,69 +554,55 @@ def regenerate_doxygen(repo_id):
 
 @app.route('/api/repos/<repo_id>/doxygen', methods=['GET'])
 def get_doxygen_status(repo_id):
-    """Get Doxygen generation status for a repository."""
-    if repo_id in doxygen_status:
-        return jsonify(doxygen_status[repo_id])
+    """
+    Get Doxygen generation status for a repository.
+
+    With ?wait=<seconds>, blocks until a running generation finishes or the timeout expires.
+    """
+    wait = request.args.get('wait', type=float)
+    if wait:
+        DOXYGEN_STATUS.long_poll(repo_id, min(wait, 60.0))
+
+    etag = f'doxygen-{ETAG_EPOCH}-{DOXYGEN_STATUS.version}-{REPO_STORE.current_version()}'
+    return _conditional(etag, lambda: jsonify(_doxygen_status_payload(repo_id)))
+
+
+def _doxygen_status_payload(repo_id: str) -> dict:
+    status = DOXYGEN_STATUS.get(repo_id)
+    if status is not None:
+        return status
 
     # Check if Doxygen data already exists
-    config_file = CONFIG['workspace'] / 'repos.json'
-    if config_file.exists():
-        with open(config_file, 'r') as f:
-            configs = json.load(f)
-
-        repo_config = next((r for r in configs if r['id'] == repo_id), None)
-        if repo_config:
-            repo = Repo(
-                url=repo_config['url'],
-                repos_folder=CONFIG['repos'],
-                git_path=CONFIG['git_path']
-            )
-            if repo.has_doxygen_data():
-                return jsonify({
-                    'status': 'completed',
-                    'message': 'Doxygen data available'
-                })
+    repo = _get_repo(repo_id)
+    if repo is not None and repo.has_doxygen_data():
+        return {
+            'status': 'completed',
+            'message': 'Doxygen data available'
+        }
 
-    return jsonify({
+    return {
         'status': 'not_generated',
         'message': 'Doxygen data has not been generated for this repository'
-    })
+    }
 
 
 @app.route('/api/repos/<repo_id>', methods=['PUT'])
 def update_repo(repo_id):
     """Update a repository configuration"""
-    config_file = CONFIG['workspace'] / 'repos.json'
-    if not config_file.exists():
-        return jsonify({'error': 'No repositories found'}), 404
-
-    with open(config_file, 'r') as f:
-        configs = json.load(f)
-
-    # Find and update the repo
     data = request.json
-    updated = False
-    for repo in configs:
-        if repo['id'] == repo_id:
-            # Update repo name from URL if URL changed
-            if 'url' in data:
-                repo['url'] = data['url']
-                repo['name'] = Repo.get_repo_name(data['url'])
-            if 'post_checkout' in data:
-                repo['post_checkout'] = data['post_checkout']
-            if 'build_command' in data:
-                repo['build_command'] = data['build_command']
-            if 'single_tu_command' in data:
-                repo['single_tu_command'] = data['single_tu_command']
-            updated = True
-            updated_repo = repo
-            break
-
-    if not updated:
+    changes = {}
+    # Update repo name from URL if URL changed
+    if 'url' in data:
+        changes['url'] = data['url']
+        changes['name'] = Repo.get_repo_name(data['url'])
+    for key in ('post_checkout', 'build_command', 'single_tu_command'):
+        if key in data:
+            changes[key] = data[key]
+
+    updated_repo = REPO_STORE.update(repo_id, changes)
+    if updated_repo is None:
         return jsonify({'error': 'Repository not found'}), 404
-
-    with open(config_file, 'w') as f:
-        json.dump(configs, f, indent=2)
+    _invalidate_repo(repo_id)
 
     return jsonify(updated_repo)
 
@@ -321,12 +610,10 @@ def update_repo(repo_id):
 def submit_mod():
     """Submit a new mod for processing"""
     logger.info("submit_mod called")
-    print("=== submit_mod called ===")
     data = request.json
-    logger.debug(f"Received mod submission: {data}")
-    print(f"Received data: {data}")
-    mod_id = str(uuid.uuid4())
-    logger.info(f"Generated mod_id: {mod_id}")
+    logger.debug("Received mod submission: %s", data)
+    mod_id = uuid.uuid4().hex
+    logger.info("Generated mod_id: %s", mod_id)
 
     # Get mod type and create mod instance
     mod_type_id = data.get('mod_type')
@@ -354,7 +641,11 @@ def submit_mod():
     )
 
     # Queue the ModRequest object (not dict!)
-    mod_queue.put(mod_request)
+    _active_mod_ids[mod_id] = None
+    with _mod_condition:
+        _mod_deque.append(mod_request)
+        _mod_condition.notify()
+    results_version.bump()
 
     # Return JSON response with string IDs for frontend
     response_data = {
@@ -371,36 +662,179 @@ def submit_mod():
 @app.route('/api/mods/<mod_id>/status')
 def get_mod_status(mod_id):
     """Get the status of a specific mod"""
-    if mod_id in results:
-        return jsonify(results[mod_id].to_dict())
-    return jsonify({'status': 'not_found'}), 404
+    result = results.get(mod_id)
+    if result is None:
+        return jsonify({'status': 'not_found'}), 404
+    body = _result_bytes.get(result)
+    if body is None:
+        body = orjson.dumps(result.to_dict())
+        if result.status in TERMINAL_RESULT_STATUSES:
+            _result_bytes[result] = body
+    return app.response_class(body, mimetype='application/json')
 
 @app.route('/api/queue/status')
 def get_queue_status():
-    """Get overall queue status"""
-    return jsonify({
-        'queue_size': mod_queue.qsize(),
-        'results': {k: v.to_dict() for k, v in results.items()}
-    })
+    """
+    Get overall queue status
+
+    Query parameters:
+        - status: 'active' to return only queued and processing mods
+    """
+    status_filter = request.args.get('status')
+    if status_filter not in (None, 'active'):
+        return jsonify({'error': f'Unknown status filter: {status_filter}'}), 400
+
+    def build():
+        if status_filter == 'active':
+            entries = ((mod_id, results.get(mod_id)) for mod_id in list(_active_mod_ids))
+            entries = [(mod_id, result) for mod_id, result in entries if result is not None]
+        else:
+            entries = results.items_snapshot()
+        return _json_response({
+            'queue_size': len(_mod_deque),
+            'results': {k: v.to_dict() for k, v in entries}
+        })
+
+    return _conditional(f'queue-{ETAG_EPOCH}-{results_version.value}', build)
 
 @app.route('/api/available/mods')
 def get_available_mods():
     """Get list of available mods"""
-    return jsonify(ModFactory.get_available_mods())
+    return _static_response(_AVAILABLE_MODS)
 
 @app.route('/api/available/validators')
 def get_available_validators():
     """Get list of available validators"""
-    return jsonify(ValidatorFactory.get_available_validators())
+    return _static_response(_AVAILABLE_VALIDATORS)
 
 @app.route('/api/available/compilers')
 def get_available_compilers():
     """Get list of available compilers"""
-    return jsonify(CompilerFactory.get_available_compilers())
+    return _static_response(_AVAILABLE_COMPILERS)
+
+@app.route('/api/available/doxygen/refresh', methods=['POST'])
+def refresh_doxygen_available():
+    """Re-probe for Doxygen, e.g. after it was installed while the server is running"""
+    _doxygen_available.cache_clear()
+    return jsonify({'available': _doxygen_available()})
 
 
 # ==================== Function Dependency API ====================
 
+# Fetch all serialized attributes in one C-level call per symbol
+_FUNCTION_ATTRS = attrgetter('name', 'qualified_name', 'file_path', 'line_start', 'return_type', 'parameters',
+                             'is_member', 'class_name', 'calls', 'called_by', 'doxygen_id')
+_SYMBOL_ATTRS = attrgetter('kind', 'name', 'qualified_name', 'file_path', 'line_start', 'line_end',
+                           'doxygen_id', 'dependencies')
+
+
+def _function_to_dict(func) -> dict:
+    (name, qualified_name, file_path, line_start, return_type, parameters,
+     is_member, class_name, calls, called_by, doxygen_id) = _FUNCTION_ATTRS(func)
+    return {
+        'name': name,
+        'qualified_name': qualified_name,
+        'file_path': file_path,
+        'line_number': line_start,
+        'return_type': return_type,
+        'parameters': [{'type': t, 'name': n} for t, n in parameters],
+        'signature': func.get_signature(),
+        'is_member': is_member,
+        'class_name': class_name,
+        'calls_count': len(calls),
+        'called_by_count': len(called_by),
+        'doxygen_id': doxygen_id
+    }
+
+
+def _symbol_to_dict(symbol) -> dict:
+    kind, name, qualified_name, file_path, line_start, line_end, doxygen_id, dependencies = _SYMBOL_ATTRS(symbol)
+    symbol_data = {
+        'kind': kind.value,
+        'name': name,
+        'qualified_name': qualified_name,
+        'file_path': file_path,
+        'line_start': line_start,
+        'line_end': line_end,
+        'doxygen_id': doxygen_id,
+        'dependencies_count': len(dependencies)
+    }
+
+    if kind == SymbolKind.FUNCTION:
+        symbol_data['return_type'] = symbol.return_type
+        symbol_data['parameters'] = [{'type': t, 'name': n} for t, n in symbol.parameters]
+        symbol_data['is_member'] = symbol.is_member
+        symbol_data['class_name'] = symbol.class_name
+    elif kind in (SymbolKind.CLASS, SymbolKind.STRUCT):
+        symbol_data['base_classes'] = symbol.base_classes
+        symbol_data['member_count'] = len(symbol.members)
+    elif kind == SymbolKind.ENUM:
+        symbol_data['value_count'] = len(symbol.enum_values)
+
+    return symbol_data
+
+
+def _stream_json(key: str, items: list, to_dict, total: int = None):
+    """
+    Yield {"count": N, key: [...]} one item at a time so large responses are never built in memory.
+
+    If total is given it is emitted as well, for paginated responses.
+    """
+    if total is None:
+        yield b'{"count":%d,"%s":[' % (len(items), key.encode())
+    else:
+        yield b'{"count":%d,"total":%d,"%s":[' % (len(items), total, key.encode())
+    separator = b''
+    for item in items:
+        yield separator + orjson.dumps(to_dict(item))
+        separator = b','
+    yield b']}'
+
+
+def _write_json_snapshots(repo: Repo):
+    """Dump unfiltered function and symbol listings next to the Doxygen XML for the *.raw endpoints."""
+    parser = repo.get_doxygen_parser()
+    if parser is None:
+        return
+    for key, items, to_dict in (('functions', parser.get_all_functions(), _function_to_dict),
+                                ('symbols', parser.get_all_symbols(), _symbol_to_dict)):
+        path = repo.get_doxygen_dir() / f'{key}.json'
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'wb') as f:
+            f.writelines(_stream_json(key, items, to_dict))
+        os.replace(tmp, path)
+
+
+def _send_json_snapshot(repo_id: str, key: str):
+    repo = _get_repo(repo_id)
+    if repo is None:
+        return jsonify({'error': 'Repository not found'}), 404
+
+    path = repo.get_doxygen_dir() / f'{key}.json'
+    if not path.is_file():
+        return jsonify({
+            'error': 'Doxygen data not available',
+            'message': 'Run POST /api/repos/{repo_id}/doxygen to generate'
+        }), 404
+
+    return send_file(path.absolute(), mimetype='application/json', conditional=True)
+
+
+@app.route('/api/repos/<repo_id>/functions.raw', methods=['GET'])
+def get_repo_functions_raw(repo_id):
+    """Serve the unfiltered function listing written at Doxygen generation time."""
+    return _send_json_snapshot(repo_id, 'functions')
+
+
+@app.route('/api/repos/<repo_id>/symbols.raw', methods=['GET'])
+def get_symbols_raw(repo_id):
+    """Serve the unfiltered symbol listing written at Doxygen generation time."""
+    return _send_json_snapshot(repo_id, 'symbols')
+
+
+DEFAULT_PAGE_SIZE = 1000
+
+
 @app.route('/api/repos/<repo_id>/functions', methods=['GET'])
 def get_repo_functions(repo_id):
     """
@@ -409,24 +843,13 @@ def get_repo_functions(repo_id):
     Query parameters:
         - name: Filter by function name
         - file: Filter by file path
+        - limit: Maximum number of functions to return (default 1000)
+        - offset: Number of functions to skip (default 0)
     """
-    config_file = CONFIG['workspace'] / 'repos.json'
-    if not config_file.exists():
-        return jsonify({'error': 'No repositories found'}), 404
-
-    with open(config_file, 'r') as f:
-        configs = json.load(f)
-
-    repo_config = next((r for r in configs if r['id'] == repo_id), None)
-    if repo_config is None:
+    repo = _get_repo(repo_id)
+    if repo is None:
         return jsonify({'error': 'Repository not found'}), 404
 
-    repo = Repo(
-        url=repo_config['url'],
-        repos_folder=CONFIG['repos'],
-        git_path=CONFIG['git_path']
-    )
-
     if not repo.has_doxygen_data():
         return jsonify({
             'error': 'Doxygen data not available',
@@ -440,6 +863,10 @@ def get_repo_functions(repo_id):
     # Get query parameters
     name_filter = request.args.get('name')
     file_filter = request.args.get('file')
+    limit = request.args.get('limit', DEFAULT_PAGE_SIZE, type=int)
+    offset = request.args.get('offset', 0, type=int)
+    if limit < 0 or offset < 0:
+        return jsonify({'error': 'limit and offset must be non-negative'}), 400
 
     if name_filter:
         functions = parser.get_functions_by_name(name_filter)
@@ -448,50 +875,20 @@ def get_repo_functions(repo_id):
     else:
         functions = parser.get_all_functions()
 
-    # Convert to JSON-serializable format
-    result = []
-    for func in functions:
-        result.append({
-            'name': func.name,
-            'qualified_name': func.qualified_name,
-            'file_path': func.file_path,
-            'line_number': func.line_number,
-            'return_type': func.return_type,
-            'parameters': [{'type': t, 'name': n} for t, n in func.parameters],
-            'signature': func.get_signature(),
-            'is_member': func.is_member,
-            'class_name': func.class_name,
-            'calls_count': len(func.calls),
-            'called_by_count': len(func.called_by),
-            'doxygen_id': func.doxygen_id
-        })
-
-    return jsonify({
-        'count': len(result),
-        'functions': result
-    })
+    page = list(itertools.islice(functions, offset, offset + limit))
+    return app.response_class(
+        stream_with_context(_stream_json('functions', page, _function_to_dict, total=len(functions))),
+        mimetype='application/json'
+    )
 
 
 @app.route('/api/repos/<repo_id>/functions/<path:doxygen_id>/callers', methods=['GET'])
 def get_function_callers(repo_id, doxygen_id):
     """Get all functions that call a specific function."""
-    config_file = CONFIG['workspace'] / 'repos.json'
-    if not config_file.exists():
-        return jsonify({'error': 'No repositories found'}), 404
-
-    with open(config_file, 'r') as f:
-        configs = json.load(f)
-
-    repo_config = next((r for r in configs if r['id'] == repo_id), None)
-    if repo_config is None:
+    repo = _get_repo(repo_id)
+    if repo is None:
         return jsonify({'error': 'Repository not found'}), 404
 
-    repo = Repo(
-        url=repo_config['url'],
-        repos_folder=CONFIG['repos'],
-        git_path=CONFIG['git_path']
-    )
-
     parser = repo.get_doxygen_parser()
     if parser is None:
         return jsonify({'error': 'Doxygen data not available'}), 404
@@ -505,11 +902,11 @@ def get_function_callers(repo_id, doxygen_id):
         'name': f.name,
         'qualified_name': f.qualified_name,
         'file_path': f.file_path,
-        'line_number': f.line_number,
+        'line_number': f.line_start,
         'doxygen_id': f.doxygen_id
     } for f in callers]
 
-    return jsonify({
+    return _json_response({
         'function': func.qualified_name,
         'callers': result
     })
@@ -518,23 +915,10 @@ def get_function_callers(repo_id, doxygen_id):
 @app.route('/api/repos/<repo_id>/functions/<path:doxygen_id>/callees', methods=['GET'])
 def get_function_callees(repo_id, doxygen_id):
     """Get all functions called by a specific function."""
-    config_file = CONFIG['workspace'] / 'repos.json'
-    if not config_file.exists():
-        return jsonify({'error': 'No repositories found'}), 404
-
-    with open(config_file, 'r') as f:
-        configs = json.load(f)
-
-    repo_config = next((r for r in configs if r['id'] == repo_id), None)
-    if repo_config is None:
+    repo = _get_repo(repo_id)
+    if repo is None:
         return jsonify({'error': 'Repository not found'}), 404
 
-    repo = Repo(
-        url=repo_config['url'],
-        repos_folder=CONFIG['repos'],
-        git_path=CONFIG['git_path']
-    )
-
     parser = repo.get_doxygen_parser()
     if parser is None:
         return jsonify({'error': 'Doxygen data not available'}), 404
@@ -548,11 +932,11 @@ def get_function_callees(repo_id, doxygen_id):
         'name': f.name,
         'qualified_name': f.qualified_name,
         'file_path': f.file_path,
-        'line_number': f.line_number,
+        'line_number': f.line_start,
         'doxygen_id': f.doxygen_id
     } for f in callees]
 
-    return jsonify({
+    return _json_response({
         'function': func.qualified_name,
         'callees': result
     })
@@ -561,55 +945,32 @@ def get_function_callees(repo_id, doxygen_id):
 @app.route('/api/repos/<repo_id>/files', methods=['GET'])
 def get_repo_files(repo_id):
     """Get list of all files with parsed functions in a repository."""
-    config_file = CONFIG['workspace'] / 'repos.json'
-    if not config_file.exists():
-        return jsonify({'error': 'No repositories found'}), 404
-
-    with open(config_file, 'r') as f:
-        configs = json.load(f)
-
-    repo_config = next((r for r in configs if r['id'] == repo_id), None)
-    if repo_config is None:
+    repo = _get_repo(repo_id)
+    if repo is None:
         return jsonify({'error': 'Repository not found'}), 404
 
-    repo = Repo(
-        url=repo_config['url'],
-        repos_folder=CONFIG['repos'],
-        git_path=CONFIG['git_path']
-    )
-
     parser = repo.get_doxygen_parser()
     if parser is None:
         return jsonify({'error': 'Doxygen data not available'}), 404
 
-    files = parser.get_all_files()
-    return jsonify({
-        'count': len(files),
-        'files': files
-    })
+    def build():
+        files = parser.get_all_files()
+        return jsonify({
+            'count': len(files),
+            'files': files
+        })
+
+    return _conditional(f'files-{ETAG_EPOCH}-{DOXYGEN_STATUS.version}-{REPO_STORE.current_version()}', build)
 
 
 @app.route('/api/repos/<repo_id>/symbols', methods=['GET'])
 def get_symbols(repo_id):
     """Get symbols from repository with optional filtering."""
-    config_file = CONFIG['workspace'] / 'repos.json'
-    if not config_file.exists():
-        return jsonify({'error': 'No repositories found'}), 404
-
-    with open(config_file, 'r') as f:
-        configs = json.load(f)
-
-    repo_config = next((r for r in configs if r['id'] == repo_id), None)
-    if repo_config is None:
+    repo = _get_repo(repo_id)
+    if repo is None:
         return jsonify({'error': 'Repository not found'}), 404
 
-    repo = Repo(
-        url=repo_config['url'],
-        repos_folder=CONFIG['repos'],
-        git_path=CONFIG['git_path']
-    )
-
-    if doxygen_status.get(repo_id, {}).get('status') != 'completed':
+    if not DOXYGEN_STATUS.is_completed(repo_id):
         return jsonify({
             'error': 'Doxygen data not available',
             'message': 'Run POST /api/repos/{repo_id}/doxygen to generate'
@@ -623,68 +984,51 @@ def get_symbols(repo_id):
     file_filter = request.args.get('file')
     name_filter = request.args.get('name')
 
+    kind = None
     if kind_filter:
-        symbols = parser.get_symbols_by_kind(kind_filter)
+        try:
+            kind = SymbolKind(kind_filter)
+        except ValueError:
+            return jsonify({'error': f'Unknown symbol kind: {kind_filter}'}), 400
+
+    if _parsers_by_id.get(id(parser)) is not parser:
+        # A new parser (e.g. after the XML changed) may reuse a dead parser's id
+        _filtered_symbols_bytes.cache_clear()
+        _parsers_by_id[id(parser)] = parser
+    return app.response_class(
+        _filtered_symbols_bytes(id(parser), kind, file_filter, name_filter),
+        mimetype='application/json'
+    )
+
+
+# Parsers seen by get_symbols, so cached results can be keyed on id(parser)
+_parsers_by_id = weakref.WeakValueDictionary()
+
+
+@functools.lru_cache(maxsize=256)
+def _filtered_symbols_bytes(parser_id: int, kind, file_filter, name_filter) -> bytes:
+    """Serialized get_symbols response for one filter combination. Cleared when Doxygen data changes."""
+    parser = _parsers_by_id[parser_id]
+    if kind is not None:
+        symbols = parser.get_symbols_by_kind(kind)
     elif file_filter:
         symbols = parser.get_symbols_in_file(file_filter)
     else:
         symbols = parser.get_all_symbols()
 
     if name_filter:
-        symbols = [s for s in symbols if name_filter.lower() in s.name.lower()]
-
-    result = []
-    for symbol in symbols:
-        symbol_data = {
-            'kind': symbol.kind,
-            'name': symbol.name,
-            'qualified_name': symbol.qualified_name,
-            'file_path': symbol.file_path,
-            'line_start': symbol.line_start,
-            'line_end': symbol.line_end,
-            'doxygen_id': symbol.doxygen_id,
-            'dependencies_count': len(symbol.dependencies)
-        }
+        symbols = parser.filter_symbols_by_name(symbols, name_filter)
 
-        if symbol.kind == 'function':
-            symbol_data['return_type'] = symbol.return_type
-            symbol_data['parameters'] = [{'type': t, 'name': n} for t, n in symbol.parameters]
-            symbol_data['is_member'] = symbol.is_member
-            symbol_data['class_name'] = symbol.class_name
-        elif symbol.kind in ('class', 'struct'):
-            symbol_data['base_classes'] = symbol.base_classes
-            symbol_data['member_count'] = len(symbol.members)
-        elif symbol.kind == 'enum':
-            symbol_data['value_count'] = len(symbol.enum_values)
-
-        result.append(symbol_data)
-
-    return jsonify({
-        'count': len(result),
-        'symbols': result
-    })
+    return b''.join(_stream_json('symbols', symbols, _symbol_to_dict))
 
 
 @app.route('/api/repos/<repo_id>/symbols/<path:symbol_id>', methods=['GET'])
 def get_symbol_details(repo_id, symbol_id):
     """Get detailed information about a specific symbol."""
-    config_file = CONFIG['workspace'] / 'repos.json'
-    if not config_file.exists():
-        return jsonify({'error': 'No repositories found'}), 404
-
-    with open(config_file, 'r') as f:
-        configs = json.load(f)
-
-    repo_config = next((r for r in configs if r['id'] == repo_id), None)
-    if repo_config is None:
+    repo = _get_repo(repo_id)
+    if repo is None:
         return jsonify({'error': 'Repository not found'}), 404
 
-    repo = Repo(
-        url=repo_config['url'],
-        repos_folder=CONFIG['repos'],
-        git_path=CONFIG['git_path']
-    )
-
     parser = repo.get_doxygen_parser()
     if parser is None:
         return jsonify({'error': 'Doxygen data not available'}), 404
@@ -694,7 +1038,7 @@ def get_symbol_details(repo_id, symbol_id):
         return jsonify({'error': 'Symbol not found'}), 404
 
     result = {
-        'kind': symbol.kind,
+        'kind': symbol.kind.value,
         'name': symbol.name,
         'qualified_name': symbol.qualified_name,
         'file_path': symbol.file_path,
@@ -704,7 +1048,7 @@ def get_symbol_details(repo_id, symbol_id):
         'dependencies': list(symbol.dependencies)
     }
 
-    if symbol.kind == 'function':
+    if symbol.kind == SymbolKind.FUNCTION:
         result['return_type'] = symbol.return_type
         result['return_type_expanded'] = symbol.return_type_expanded
         result['parameters'] = [{'type': t, 'name': n} for t, n in symbol.parameters]
@@ -715,35 +1059,22 @@ def get_symbol_details(repo_id, symbol_id):
         result['class_name'] = symbol.class_name
         result['calls'] = list(symbol.calls)
         result['called_by'] = list(symbol.called_by)
-    elif symbol.kind in ('class', 'struct'):
+    elif symbol.kind in (SymbolKind.CLASS, SymbolKind.STRUCT):
         result['base_classes'] = symbol.base_classes
         result['members'] = symbol.members
-    elif symbol.kind == 'enum':
+    elif symbol.kind == SymbolKind.ENUM:
         result['enum_values'] = [{'name': n, 'value': v} for n, v in symbol.enum_values]
 
-    return jsonify(result)
+    return _json_response(result)
 
 
 @app.route('/api/repos/<repo_id>/symbols/<path:symbol_id>/dependencies', methods=['GET'])
 def get_symbol_dependencies(repo_id, symbol_id):
     """Get symbols that this symbol depends on."""
-    config_file = CONFIG['workspace'] / 'repos.json'
-    if not config_file.exists():
-        return jsonify({'error': 'No repositories found'}), 404
-
-    with open(config_file, 'r') as f:
-        configs = json.load(f)
-
-    repo_config = next((r for r in configs if r['id'] == repo_id), None)
-    if repo_config is None:
+    repo = _get_repo(repo_id)
+    if repo is None:
         return jsonify({'error': 'Repository not found'}), 404
 
-    repo = Repo(
-        url=repo_config['url'],
-        repos_folder=CONFIG['repos'],
-        git_path=CONFIG['git_path']
-    )
-
     parser = repo.get_doxygen_parser()
     if parser is None:
         return jsonify({'error': 'Doxygen data not available'}), 404
@@ -780,4 +1111,5 @@ def get_symbol_dependencies(repo_id, symbol_id):
 
 
 if __name__ == '__main__':
-    app.run(debug=False, host='0.0.0.0', port=5000, use_reloader=False)
+    # Thread per request: handlers block on subprocesses and file I/O, which release the GIL
+    app.run(debug=False, host='0.0.0.0', port=5000, use_reloader=False, threaded=True)
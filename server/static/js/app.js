@@ -356,7 +356,7 @@ async function trackModStatus(modId) {
 // Queued Mods Management
 async function loadQueuedMods() {
     try {
-        const response = await fetch(`${API_BASE}/queue/status`);
+        const response = await fetch(`${API_BASE}/queue/status?status=active`);
         const status = await response.json();
         displayQueuedMods(status);
     } catch (error) {